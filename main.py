@@ -472,8 +472,8 @@ class NFCThread(QThread):
         if self.reader_type and self.reader_type != 'Auto-Detect':
             # Use reader-specific connection strategy
             if self.reader_config:
-                backend = self.reader_config.get('backend', 'usb')
-                vid_pid_list = self.reader_config.get('vid_pid', [])
+                backend = self.reader_config.backend
+                vid_pid_list = self.reader_config.vid_pid or ()
                 
                 if backend == 'usb' and self.selected_port:
                     # Try direct USB connection to selected port
@@ -881,10 +881,10 @@ class NFCThread(QThread):
         
         Args:
             reader_type (str): Type of reader (e.g., 'Auto-Detect', 'USB', 'PC/SC', 'UART')
-            reader_config (dict, optional): Configuration for the specific reader type
+            reader_config (ReaderConfig, optional): Configuration for the specific reader type
         """
         self.reader_type = reader_type
-        self.reader_config = reader_config or {}
+        self.reader_config = reader_config
         self.logger.info(f"Reader type set to: {reader_type}")
         if reader_config:
             self.logger.info(f"Reader configuration: {reader_config}")
@@ -1610,6 +1610,7 @@ class NFCApp(QMainWindow):
         self.log("Application shutting down...")
         self.nfc_thread.stop()
         self.device_panel.disconnect_device()
+        self.device_panel.close_port()
         logging.shutdown()
         event.accept()
     
@@ -1642,6 +1643,10 @@ class NFCApp(QMainWindow):
             # Stop NFC operations but keep the thread running
             if hasattr(self.nfc_thread, 'clf') and self.nfc_thread.clf:
                 self.nfc_thread.clf.close()
+            
+            # The running NFC thread may reopen the port; don't hold it idle
+            if self.nfc_thread.isRunning():
+                self.device_panel.release_idle_port()
     
     def on_reader_type_changed(self, reader_type):
         """Handle reader type changes."""
@@ -1655,6 +1660,7 @@ class NFCApp(QMainWindow):
             # Restart NFC thread with new reader type
             if self.nfc_thread.isRunning():
                 self.nfc_thread.stop()
+            self.device_panel.release_idle_port()
             self.nfc_thread.start()
     
     def start_reading(self):
@@ -1758,6 +1764,9 @@ class NFCApp(QMainWindow):
             import sys
             from script.nfc_diagnostics import run_diagnostics
             
+            # Diagnostics open every port; release the panel's idle handle
+            self.device_panel.release_idle_port()
+            
             # Capture stdout
             old_stdout = sys.stdout
             sys.stdout = captured_output = io.StringIO()
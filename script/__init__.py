@@ -5,10 +5,22 @@ This package contains the core functionality for the NFC Reader/Writer applicati
 including NFC operations, authentication, and user interface components.
 """
 
-# Import core components
-from .nfc_operations import NfcOperations
-from .auth import AuthManager, PasswordDialog
-from .recovery_dialog import RecoveryDialog
+# Core components are resolved lazily (PEP 562) so that importing the package,
+# e.g. just to read the version, does not pull in PySide6 or nfcpy.
+__all__ = ["NfcOperations", "AuthManager", "PasswordDialog", "RecoveryDialog"]
 
 # Define package version
 __version__ = '1.1.0'
+
+
+def __getattr__(name):
+    if name == "NfcOperations":
+        from .nfc_operations import NfcOperations
+        return NfcOperations
+    if name in ("AuthManager", "PasswordDialog"):
+        from . import auth
+        return getattr(auth, name)
+    if name == "RecoveryDialog":
+        from .recovery_dialog import RecoveryDialog
+        return RecoveryDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
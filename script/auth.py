@@ -3,30 +3,80 @@ Authentication and password management for sensitive operations.
 """
 import os
 import hashlib
+import hmac
 import json
 import logging
 from typing import Optional, Tuple
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QLineEdit, QPushButton, 
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, 
     QLabel, QMessageBox, QCheckBox, QFileDialog,
-    QFrame
+    QDialogButtonBox
 )
-from PySide6.QtCore import Qt, Signal, QSettings
-from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QLineEdit, QPushButton, 
-    QLabel, QMessageBox, QCheckBox, QFileDialog,
-    QFrame, QDialogButtonBox
-)
-from .password_strength import PasswordStrengthMeter, PasswordValidator
+from PySide6.QtCore import Qt, Signal
 from pathlib import Path
 
 # Add these imports at the top of auth.py
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# PBKDF2-HMAC-SHA256 work factor for password hashes
+PBKDF2_ITERATIONS = 100000
+
+# Current recovery key file format version
+RECOVERY_KEY_VERSION = 2
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Login attempts data per attempts file: path -> ((st_mtime_ns, st_size), data).
+# Shared by all AuthManager instances in the process; an entry is reused only
+# while the file on disk is unchanged, so writes from elsewhere are seen.
+_ATTEMPTS_CACHE = {}
+
+
+# Recent PBKDF2 results on the verify path: (salt, sha256(password)) -> hash.
+# Keyed by a digest so typed passwords are never kept in memory; cleared on
+# successful login and password change.
+_PBKDF2_CACHE = {}
+_PBKDF2_CACHE_SIZE = 8
+
+
+def _pbkdf2_cached(password: bytes, salt: bytes) -> str:
+    """Derive a password hash, memoizing the last few results for verification.
+    
+    Only used on the verify path so identical retries skip the key derivation.
+    """
+    key = (salt, hashlib.sha256(password).digest())
+    hashed = _PBKDF2_CACHE.get(key)
+    if hashed is None:
+        hashed = hashlib.pbkdf2_hmac('sha256', password, salt, PBKDF2_ITERATIONS, dklen=32).hex()
+        if len(_PBKDF2_CACHE) >= _PBKDF2_CACHE_SIZE:
+            # Evict the oldest entry
+            del _PBKDF2_CACHE[next(iter(_PBKDF2_CACHE))]
+        _PBKDF2_CACHE[key] = hashed
+    return hashed
+
+
 class AuthManager:
     """Handles password hashing, verification, and brute force protection."""
     
@@ -41,31 +91,44 @@ class AuthManager:
         self.attempts_file = self.config_dir / "login_attempts.json"
         self.salt = None
         self.password_hash = None
+        self._attempts_key = str(self.attempts_file.resolve())
         self._load_config()
         self._ensure_attempts_file()
         
     def _ensure_attempts_file(self):
         """Ensure the login attempts file exists."""
         if not self.attempts_file.exists():
-            with open(self.attempts_file, 'w') as f:
-                json.dump({"attempts": 0, "last_attempt": None, "locked_until": None}, f)
+            with open(self.attempts_file, 'wb') as f:
+                f.write(_dumps({"attempts": 0, "last_attempt": None, "locked_until": None}))
     
     def _load_attempts(self):
-        """Load login attempts data."""
+        """Load login attempts data, re-reading the file only when it changed."""
         try:
-            with open(self.attempts_file, 'r') as f:
-                return json.load(f)
+            st = os.stat(self.attempts_file)
+            cached = _ATTEMPTS_CACHE.get(self._attempts_key)
+            if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+                return cached[1]
+            with open(self.attempts_file, 'rb') as f:
+                st = os.fstat(f.fileno())
+                attempts_data = _loads(f.read())
         except Exception as e:
             logger.error(f"Error loading login attempts: {e}")
             return {"attempts": 0, "last_attempt": None, "locked_until": None}
+        _ATTEMPTS_CACHE[self._attempts_key] = ((st.st_mtime_ns, st.st_size), attempts_data)
+        return attempts_data
     
     def _save_attempts(self, attempts_data):
-        """Save login attempts data."""
+        """Save login attempts data and update the shared in-memory copy."""
         try:
-            with open(self.attempts_file, 'w') as f:
-                json.dump(attempts_data, f)
+            with open(self.attempts_file, 'wb') as f:
+                f.write(_dumps(attempts_data))
+                f.flush()
+                st = os.fstat(f.fileno())
         except Exception as e:
+            _ATTEMPTS_CACHE.pop(self._attempts_key, None)
             logger.error(f"Error saving login attempts: {e}")
+            return
+        _ATTEMPTS_CACHE[self._attempts_key] = ((st.st_mtime_ns, st.st_size), attempts_data)
     
     def is_locked_out(self):
         """Check if the account is locked due to too many failed attempts."""
@@ -73,8 +136,10 @@ class AuthManager:
         locked_until = attempts_data.get("locked_until")
         
         if locked_until:
-            locked_until = datetime.fromisoformat(locked_until)
-            if datetime.now() < locked_until:
+            if isinstance(locked_until, str):
+                # Files written by older versions store an ISO timestamp
+                locked_until = datetime.fromisoformat(locked_until).timestamp()
+            if time.time() < locked_until:
                 return True, locked_until
             else:
                 # Reset if lockout period has passed
@@ -84,28 +149,34 @@ class AuthManager:
     
     def _reset_attempts(self):
         """Reset the failed login attempts counter."""
+        _PBKDF2_CACHE.clear()
         self._save_attempts({
             "attempts": 0,
             "last_attempt": None,
             "locked_until": None
         })
     
-    def record_failed_attempt(self):
-        """Record a failed login attempt."""
+    def record_failed_attempt(self) -> int:
+        """Record a failed login attempt.
+        
+        Returns:
+            int: The number of consecutive failed attempts, including this one
+        """
         attempts_data = self._load_attempts()
-        now = datetime.now().isoformat()
+        now = time.time()
         
         attempts = attempts_data.get("attempts", 0) + 1
         locked_until = None
         
         if attempts >= self.MAX_ATTEMPTS:
-            locked_until = (datetime.now() + timedelta(seconds=self.LOCKOUT_DURATION)).isoformat()
+            locked_until = now + self.LOCKOUT_DURATION
         
         self._save_attempts({
             "attempts": attempts,
             "last_attempt": now,
             "locked_until": locked_until
         })
+        return attempts
     
     def verify_password(self, password: str) -> tuple[bool, str]:
         """
@@ -120,22 +191,21 @@ class AuthManager:
         # Check if account is locked
         is_locked, until = self.is_locked_out()
         if is_locked:
-            remaining = (until - datetime.now()).seconds // 60 + 1
+            remaining = int((until - time.time()) / 60) + 1
             return False, f"Account locked. Try again in {remaining} minutes."
         
         # Verify password
         if not self.password_hash:
             return False, "No password set"
             
-        hashed = self._hash_password(password)
-        if hashed == self.password_hash:
+        hashed = _pbkdf2_cached(password.encode('utf-8'), self.salt)
+        if hmac.compare_digest(hashed, self.password_hash):
             # Reset attempts on successful login
             self._reset_attempts()
             return True, "Authentication successful"
         else:
             # Record failed attempt
-            self.record_failed_attempt()
-            attempts_remaining = self.MAX_ATTEMPTS - self._load_attempts().get("attempts", 0)
+            attempts_remaining = self.MAX_ATTEMPTS - self.record_failed_attempt()
             
             if attempts_remaining <= 0:
                 return False, "Too many failed attempts. Account locked for 5 minutes."
@@ -147,8 +217,8 @@ class AuthManager:
             if not self.config_file.exists():
                 return
                 
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = _loads(f.read())
                 self.salt = bytes.fromhex(config.get('salt', ''))
                 self.password_hash = config.get('password_hash', '')
         except Exception as e:
@@ -158,11 +228,11 @@ class AuthManager:
         """Save the authentication configuration."""
         try:
             self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump({
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps({
                     'salt': self.salt.hex() if self.salt else '',
                     'password_hash': self.password_hash or ''
-                }, f, indent=4)
+                }))
         except Exception as e:
             logger.error(f"Error saving auth config: {e}")
             
@@ -173,72 +243,7 @@ class AuthManager:
             bool: True if a password is set (both hash and salt exist), False otherwise
         """
         return bool(self.password_hash and self.salt)
-        
-    def _generate_recovery_key(self, password: str, salt: bytes, 
-                            password_hash: str, output_path: str) -> bool:
-        """Generate a recovery key file.
-        
-        Args:
-            password: The password to generate recovery for
-            salt: The password salt
-            password_hash: The hashed password
-            output_path: Path to save the recovery key file
-            
-        Returns:
-            bool: True if the recovery key was generated successfully, False otherwise
-        """
-        try:
-            # Create a recovery key with the same salt as the password
-            recovery_data = {
-                'salt': salt.hex(),
-                'recovery_hash': hashlib.sha256(
-                    (salt.hex() + password_hash).encode()
-                ).hexdigest()
-            }
-            
-            # Save the recovery key to a file
-            with open(output_path, 'w') as f:
-                json.dump(recovery_data, f, indent=2)
-                
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to generate recovery key: {e}")
-            return False
-
-
-def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str) -> bool:
-    """Verify if a recovery key is valid.
     
-    Args:
-        recovery_key_path: Path to the recovery key file
-        salt: The stored password salt
-        password_hash: The stored password hash
-        
-    Returns:
-        bool: True if the recovery key is valid, False otherwise
-    """
-    try:
-        with open(recovery_key_path, 'r') as f:
-            recovery_data = json.load(f)
-            
-        # Verify the recovery key format
-        if not all(k in recovery_data for k in ['salt', 'recovery_hash']):
-            return False
-            
-        # Verify the recovery hash
-        expected_hash = hashlib.sha256(
-            (salt.hex() + password_hash).encode()
-        ).hexdigest()
-        
-        return recovery_data['recovery_hash'] == expected_hash
-        
-    except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
-        logger.error(f"Invalid recovery key: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Error verifying recovery key: {e}")
-        return False    
     def _hash_password(self, password: str, salt: bytes = None) -> Tuple[bytes, str]:
         """Hash a password with a salt.
         
@@ -256,7 +261,7 @@ def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str)
             'sha256',
             password.encode('utf-8'),
             salt,
-            100000,  # Number of iterations
+            PBKDF2_ITERATIONS,  # Number of iterations
             dklen=32  # Length of the derived key
         )
         
@@ -275,6 +280,7 @@ def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str)
         if not password:
             return False
             
+        _PBKDF2_CACHE.clear()
         self.salt, self.password_hash = self._hash_password(password)
         
         # Generate recovery key if requested
@@ -286,21 +292,6 @@ def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str)
         self._save_config()
         return True
     
-    def verify_password(self, password: str) -> bool:
-        """Verify a password against the stored hash.
-        
-        Args:
-            password: The password to verify
-            
-        Returns:
-            bool: True if the password is correct, False otherwise
-        """
-        if not self.password_hash or not self.salt:
-            return False
-            
-        _, key = self._hash_password(password, self.salt)
-        return key == self.password_hash
-        
     def recover_password(self, recovery_key_path: str, new_password: str) -> bool:
         """Recover a forgotten password using a recovery key.
         
@@ -327,10 +318,97 @@ def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str)
         except Exception as e:
             logger.error(f"Password recovery failed: {e}")
             return False
+        
+    def _generate_recovery_key(self, password: str, salt: bytes, 
+                            password_hash: str, output_path: str) -> bool:
+        """Generate a recovery key file.
+        
+        Args:
+            password: The password to generate recovery for
+            salt: The password salt
+            password_hash: The hashed password
+            output_path: Path to save the recovery key file
+            
+        Returns:
+            bool: True if the recovery key was generated successfully, False otherwise
+        """
+        return generate_recovery_key(salt, password_hash, output_path)
+
+
+def _recovery_hash(salt: bytes, password_hash: str, version: int = RECOVERY_KEY_VERSION) -> str:
+    """Compute the recovery hash for a salt and password hash.
     
-    def is_password_set(self) -> bool:
-        """Check if a password is set."""
-        return bool(self.password_hash and self.salt)
+    Version 1 keys hashed the hex-encoded salt concatenated with the password
+    hash; version 2 feeds the raw salt bytes and the hash straight to SHA-256.
+    """
+    if version < 2:
+        return hashlib.sha256((salt.hex() + password_hash).encode()).hexdigest()
+    h = hashlib.sha256()
+    h.update(salt)
+    h.update(password_hash.encode('ascii'))
+    return h.hexdigest()
+
+
+def generate_recovery_key(salt: bytes, password_hash: str, output_path: str) -> bool:
+    """Generate a recovery key file.
+    
+    Args:
+        salt: The password salt
+        password_hash: The hashed password
+        output_path: Path to save the recovery key file
+        
+    Returns:
+        bool: True if the recovery key was generated successfully, False otherwise
+    """
+    try:
+        # Create a recovery key with the same salt as the password
+        recovery_data = {
+            'v': RECOVERY_KEY_VERSION,
+            'salt': salt.hex(),
+            'recovery_hash': _recovery_hash(salt, password_hash)
+        }
+        
+        # Save the recovery key to a file
+        with open(output_path, 'w') as f:
+            json.dump(recovery_data, f, indent=2)
+            
+        return True
+        
+    except Exception as e:
+        logger.error(f"Failed to generate recovery key: {e}")
+        return False
+
+
+def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str) -> bool:
+    """Verify if a recovery key is valid.
+    
+    Args:
+        recovery_key_path: Path to the recovery key file
+        salt: The stored password salt
+        password_hash: The stored password hash
+        
+    Returns:
+        bool: True if the recovery key is valid, False otherwise
+    """
+    try:
+        with open(recovery_key_path, 'r') as f:
+            recovery_data = json.load(f)
+            
+        # Verify the recovery key format
+        if not all(k in recovery_data for k in ['salt', 'recovery_hash']):
+            return False
+            
+        # Verify the recovery hash (keys without a version are version 1)
+        expected_hash = _recovery_hash(salt, password_hash, recovery_data.get('v', 1))
+        
+        return hmac.compare_digest(recovery_data['recovery_hash'], expected_hash)
+        
+    except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
+        logger.error(f"Invalid recovery key: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Error verifying recovery key: {e}")
+        return False
 
 
 class LoginDialog(QDialog):
@@ -397,10 +475,11 @@ class LoginDialog(QDialog):
             QMessageBox.warning(self, "Error", "Please enter a password")
             return
             
-        if self.auth_manager.verify_password(password):
+        success, message = self.auth_manager.verify_password(password)
+        if success:
             self.accept()
         else:
-            QMessageBox.warning(self, "Error", "Incorrect password")
+            QMessageBox.warning(self, "Error", message)
             self.password_edit.clear()
             self.password_edit.setFocus()
     
@@ -469,6 +548,7 @@ class PasswordDialog(QDialog):
             layout.addWidget(self.new_pw_edit)
             
             # Password strength meter
+            from .password_strength import PasswordStrengthMeter
             self.strength_meter = PasswordStrengthMeter()
             layout.addWidget(self.strength_meter)
             
@@ -619,11 +699,12 @@ class PasswordDialog(QDialog):
             
             else:  # verify mode
                 password = self.new_pw_edit.text()
-                if self.auth_manager.verify_password(password):
+                success, message = self.auth_manager.verify_password(password)
+                if success:
                     self.verified.emit()
                     self.accept()
                 else:
-                    QMessageBox.warning(self, "Error", "Incorrect password.")
+                    QMessageBox.warning(self, "Error", message)
                     
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
@@ -4,13 +4,120 @@
 USB Device Management Panel for NFC Reader/Writer
 """
 
-import serial.tools.list_ports
+import logging
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import FrozenSet, Optional, Tuple
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QComboBox, QPushButton, QGroupBox, QMessageBox,
-                             QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, Signal, Slot
+                             QFrame, QSizePolicy, QCheckBox)
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import (Qt, Signal, Slot, QObject, QRunnable, QThreadPool,
+                            QTimer, QSignalBlocker, QSocketNotifier)
+import os
 import serial
 
+logger = logging.getLogger(__name__)
+
+# Four-digit lowercase hex formatter for USB vendor/product IDs
+_HEX4 = '{:04x}'.format
+
+# Item data role holding the reader type detected for a port in Auto-Detect mode
+_DETECTED_TYPE_ROLE = Qt.UserRole + 1
+
+# Item data role holding the port's ListPortInfo from the scan
+_PORT_INFO_ROLE = Qt.UserRole + 2
+
+# Vendors of common Bluetooth radios exposing SPP virtual COM ports
+_BT_SPP_VID = frozenset({0x0A12, 0x0BDA})
+
+
+def _is_bluetooth_port(port):
+    """Return True if the port is a Bluetooth SPP virtual COM port."""
+    if port.vid in _BT_SPP_VID:
+        return True
+    if port.hwid and 'BTHENUM' in port.hwid.upper():
+        return True
+    return bool(port.manufacturer and port.manufacturer.startswith('Bluetooth'))
+
+
+# Port enumeration can take seconds on some systems (e.g. Windows with
+# Bluetooth SPP ports), so results are shared for a short time
+_PORTS_CACHE = {'ts': 0.0, 'ports': None}
+
+# serial.tools.list_ports loads the platform enumeration backend (WMI,
+# libudev, IOKit), so it is imported on the first scan rather than at startup
+_list_ports = None
+
+
+def _get_list_ports():
+    """Return the serial.tools.list_ports module, importing it on first use."""
+    global _list_ports
+    if _list_ports is None:
+        import serial.tools.list_ports as list_ports
+        _list_ports = list_ports
+    return _list_ports
+
+
+def _cached_comports(ttl=2.0, force=False):
+    """Return the available serial ports, reusing a recent enumeration.
+    
+    Args:
+        ttl: Maximum age in seconds of a cached result
+        force: Always enumerate again, bypassing the cache
+        
+    Returns:
+        list: ListPortInfo objects for the available ports
+    """
+    now = time.monotonic()
+    if force or _PORTS_CACHE['ports'] is None or now - _PORTS_CACHE['ts'] >= ttl:
+        _PORTS_CACHE['ports'] = _get_list_ports().comports()
+        _PORTS_CACHE['ts'] = now
+    return _PORTS_CACHE['ports']
+
+
+@dataclass(frozen=True)
+class ReaderConfig:
+    """Static configuration of a supported reader type."""
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('description', 'vid_pid', 'backend')
+    
+    description: str
+    vid_pid: Optional[FrozenSet[Tuple[int, int]]]  # None when ports are not filtered
+    backend: str
+
+
+def _format_reader_info(config):
+    """Build the reader information text shown for a reader configuration."""
+    info_text = f"Reader: {config.description}\n"
+    info_text += f"Backend: {config.backend}"
+    
+    if config.vid_pid:
+        vid_pid_text = ", ".join([f"VID: 0x{vid:04x}, PID: 0x{pid:04x}" for vid, pid in sorted(config.vid_pid)])
+        info_text += f"\nExpected IDs: {vid_pid_text}"
+    
+    return info_text
+
+
+class _PortScanSignals(QObject):
+    """Carries port scan results from the worker thread to the GUI thread."""
+    
+    ports_ready = Signal(list)
+
+
+class _PortScanTask(QRunnable):
+    """Enumerates serial ports on a QThreadPool worker thread."""
+    
+    def __init__(self, signals, force=False):
+        super().__init__()
+        self.signals = signals
+        self.force = force
+    
+    def run(self):
+        self.signals.ports_ready.emit(list(_cached_comports(force=self.force)))
+
+
 class DevicePanel(QGroupBox):
     """Panel for managing USB serial devices."""
     
@@ -20,46 +127,94 @@ class DevicePanel(QGroupBox):
     # Signal emitted when reader type changes
     reader_type_changed = Signal(str)
     
+    # Parsed once; update_ui_* only switch the 'state' property
+    _STATUS_QSS = (
+        "QLabel[state='ok'] { color: green; font-weight: bold; }"
+        "QLabel[state='bad'] { color: red; font-weight: bold; }"
+    )
+    
+    # How long a connection error stays visible in the panel (milliseconds)
+    ERROR_DISPLAY_MS = 5000
+    
+    # Most received bytes kept for read_line()/readlines_available()
+    RX_BUFFER_LIMIT = 64 * 1024
+    
     # Supported reader types with their configurations
     READER_TYPES = {
-        'Auto-Detect': {
-            'description': 'Automatically detect the reader type',
-            'vid_pid': None,
-            'backend': 'auto'
-        },
-        'ACR122U': {
-            'description': 'ACS ACR122U NFC Reader',
-            'vid_pid': [(0x072F, 0x2200)],  # VID:PID for ACR122U
-            'backend': 'pcsc'
-        },
-        'PN532': {
-            'description': 'NXP PN532 NFC Reader',
-            'vid_pid': [(0x2341, 0x0043), (0x0403, 0x6001)],  # Common PN532 VID:PID
-            'backend': 'usb'
-        },
-        'NS106': {
-            'description': 'Kadongli NS106 Dual Frequency Reader',
-            'vid_pid': [(0x072F, 0x2200)],  # VID:PID for NS106
-            'backend': 'usb'
-        },
-        'RC522': {
-            'description': 'MFRC522 RFID Reader',
-            'vid_pid': [(0x2341, 0x0043)],  # Common Arduino-based RC522
-            'backend': 'uart'
-        },
-        'PC/SC': {
-            'description': 'Generic PC/SC Reader',
-            'vid_pid': None,
-            'backend': 'pcsc'
-        }
+        'Auto-Detect': ReaderConfig(
+            description='Automatically detect the reader type',
+            vid_pid=None,
+            backend='auto'
+        ),
+        'ACR122U': ReaderConfig(
+            description='ACS ACR122U NFC Reader',
+            vid_pid=frozenset({(0x072F, 0x2200)}),  # VID:PID for ACR122U
+            backend='pcsc'
+        ),
+        'PN532': ReaderConfig(
+            description='NXP PN532 NFC Reader',
+            vid_pid=frozenset({(0x2341, 0x0043), (0x0403, 0x6001)}),  # Common PN532 VID:PID
+            backend='usb'
+        ),
+        'NS106': ReaderConfig(
+            description='Kadongli NS106 Dual Frequency Reader',
+            vid_pid=frozenset({(0x072F, 0x2200)}),  # VID:PID for NS106
+            backend='usb'
+        ),
+        'RC522': ReaderConfig(
+            description='MFRC522 RFID Reader',
+            vid_pid=frozenset({(0x2341, 0x0043)}),  # Common Arduino-based RC522
+            backend='uart'
+        ),
+        'PC/SC': ReaderConfig(
+            description='Generic PC/SC Reader',
+            vid_pid=None,
+            backend='pcsc'
+        )
     }
     
+    # Combo box labels and reader information text, formatted once
+    _READER_DISPLAY_TEXT = {
+        reader_type: f"{reader_type} - {config.description}"
+        for reader_type, config in READER_TYPES.items()
+    }
+    _READER_INFO_TEXT = {
+        reader_type: _format_reader_info(config)
+        for reader_type, config in READER_TYPES.items()
+    }
+    
+    # Reverse index (vid, pid) -> reader type; the first listed type wins
+    _PID_INDEX = {}
+    for _reader_type, _config in READER_TYPES.items():
+        for _vid_pid in _config.vid_pid or ():
+            _PID_INDEX.setdefault(_vid_pid, _reader_type)
+    del _reader_type, _config, _vid_pid
+    
     def __init__(self, parent=None):
         """Initialize the device panel."""
         super().__init__("USB Device", parent)
         self.serial_port = None
         self.is_connected = False
+        # Keep the port open across disconnect/reconnect of the same port; the
+        # idle handle is released as soon as anything else may need the port
+        # (see release_idle_port())
+        self._persistent = True
         self.current_reader_type = 'Auto-Detect'
+        self.detected_reader_type = None
+        self._rx_buf = bytearray()
+        self._notifier = None
+        # Whether incoming data is watched and buffered, see start_receiving()
+        self._receiving = False
+        self._scan_signals = _PortScanSignals()
+        self._scan_signals.ports_ready.connect(self._apply_ports)
+        
+        # Coalesce bursts of refresh requests into a single port scan
+        self._refresh_force = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._do_refresh_ports)
+        
         self.init_ui()
         self.refresh_ports()
     
@@ -73,9 +228,11 @@ class DevicePanel(QGroupBox):
         
         self.reader_combo = QComboBox()
         self.reader_combo.setMinimumWidth(200)
-        for reader_type, config in self.READER_TYPES.items():
-            self.reader_combo.addItem(f"{reader_type} - {config['description']}", reader_type)
-        self.reader_combo.currentTextChanged.connect(self.on_reader_type_changed)
+        with QSignalBlocker(self.reader_combo):
+            for reader_type, display_text in self._READER_DISPLAY_TEXT.items():
+                self.reader_combo.addItem(display_text, reader_type)
+        self.reader_combo.currentIndexChanged.connect(
+            lambda index: self.on_reader_type_changed(self.reader_combo.itemData(index)))
         reader_layout.addWidget(self.reader_combo)
         
         layout.addLayout(reader_layout)
@@ -92,20 +249,39 @@ class DevicePanel(QGroupBox):
         
         self.port_combo = QComboBox()
         self.port_combo.setMinimumWidth(200)
+        self.port_combo.currentIndexChanged.connect(self._release_stale_port)
         port_layout.addWidget(self.port_combo)
         
         self.refresh_btn = QPushButton("🔄")
         self.refresh_btn.setToolTip("Refresh available ports")
-        self.refresh_btn.clicked.connect(self.refresh_ports)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_ports(force=True))
         port_layout.addWidget(self.refresh_btn)
         
         layout.addLayout(port_layout)
         
+        # Bluetooth SPP ports are never NFC readers, so they are hidden by default
+        self.show_virtual_check = QCheckBox("Show virtual ports")
+        self.show_virtual_check.setToolTip("Include Bluetooth virtual COM ports in the port list")
+        self.show_virtual_check.toggled.connect(lambda checked: self.refresh_ports())
+        layout.addWidget(self.show_virtual_check)
+        
         # Connection status
         self.status_label = QLabel("Status: Disconnected")
-        self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        self.status_label.setStyleSheet(self._STATUS_QSS)
+        self.status_label.setProperty('state', 'bad')
         layout.addWidget(self.status_label)
         
+        # Non-blocking error messages for connection attempts
+        self.error_label = QLabel("")
+        self.error_label.setWordWrap(True)
+        self.error_label.setStyleSheet("color: red;")
+        layout.addWidget(self.error_label)
+        
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(self.ERROR_DISPLAY_MS)
+        self._error_timer.timeout.connect(self.error_label.clear)
+        
         # Connection button
         self.connect_btn = QPushButton("Connect")
         self.connect_btn.clicked.connect(self.toggle_connection)
@@ -130,6 +306,7 @@ class DevicePanel(QGroupBox):
     
     def on_reader_type_changed(self, reader_type):
         """Handle reader type selection change."""
+        self.release_idle_port()
         self.current_reader_type = reader_type
         self.reader_type_changed.emit(reader_type)
         self.update_reader_info()
@@ -137,67 +314,98 @@ class DevicePanel(QGroupBox):
     
     def update_reader_info(self):
         """Update the reader-specific information display."""
-        if self.current_reader_type in self.READER_TYPES:
-            config = self.READER_TYPES[self.current_reader_type]
-            info_text = f"Reader: {config['description']}\n"
-            info_text += f"Backend: {config['backend']}"
-            
-            if config['vid_pid']:
-                vid_pid_text = ", ".join([f"VID: 0x{vid:04x}, PID: 0x{pid:04x}" for vid, pid in config['vid_pid']])
-                info_text += f"\nExpected IDs: {vid_pid_text}"
-            
-            self.reader_info_label.setText(info_text)
-        else:
-            self.reader_info_label.setText("")
+        self.reader_info_label.setText(self._READER_INFO_TEXT.get(self.current_reader_type, ''))
     
-    def refresh_ports(self):
-        """Refresh the list of available serial ports."""
-        self.port_combo.clear()
-        ports = serial.tools.list_ports.comports()
+    def refresh_ports(self, force=False):
+        """Refresh the list of available serial ports.
         
-        if not ports:
-            self.port_combo.addItem("No ports found")
-            self.connect_btn.setEnabled(False)
+        Requests arriving within a short window are merged into one scan.
+        
+        Args:
+            force: Enumerate the ports again instead of using a recent result
+        """
+        self._refresh_force = self._refresh_force or force
+        self._refresh_timer.start()
+    
+    def _do_refresh_ports(self):
+        """Start a port scan.
+        
+        The enumeration runs on the global thread pool; the combo box is
+        populated by _apply_ports once the results arrive. Skipped while
+        connected: the port list is locked and connect_btn disconnects.
+        """
+        if self.is_connected:
             return
+        force, self._refresh_force = self._refresh_force, False
+        self.port_combo.clear()
+        self.port_combo.addItem("Scanning…")
+        self.connect_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(_PortScanTask(self._scan_signals, force))
+    
+    @Slot(list)
+    def _apply_ports(self, ports):
+        """Populate the port list with the results of a port scan."""
+        if self.is_connected:
+            # Connected while the scan ran; keep the selected port
+            return
+        # Repopulate in one pass: no repaints or index-change signals per item
+        self.port_combo.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.port_combo):
+                self._populate_port_combo(ports)
+        finally:
+            self.port_combo.setUpdatesEnabled(True)
+        self._release_stale_port()
+    
+    def _populate_port_combo(self, ports):
+        """Fill the port combo box with the ports compatible with the reader type.
         
+        The items are built in a fresh model that replaces the combo's model
+        in a single swap. The combo owns the model and deletes the old one.
+        """
         # Filter ports based on selected reader type
-        filtered_ports = self.filter_ports_by_reader_type(ports)
+        filtered_ports = self.filter_ports_by_reader_type(ports) if ports else []
+        
+        model = QStandardItemModel(max(len(filtered_ports), 1), 1, self.port_combo)
         
         if not filtered_ports:
-            self.port_combo.addItem("No compatible ports found")
+            model.setItem(0, 0, QStandardItem("No ports found" if not ports else "No compatible ports found"))
+            self.port_combo.setModel(model)
             self.connect_btn.setEnabled(False)
-        else:
-            for port in sorted(filtered_ports, key=lambda p: p.device):
-                display_text = f"{port.device} - {port.description}"
-                if port.vid and port.pid:
-                    display_text += f" (VID: 0x{port.vid:04x}, PID: 0x{port.pid:04x})"
-                self.port_combo.addItem(display_text, port.device)
-            self.connect_btn.setEnabled(True)
+            return
+        
+        auto_detect = self.current_reader_type == 'Auto-Detect'
+        filtered_ports.sort(key=attrgetter('device'))
+        for row, port in enumerate(filtered_ports):
+            parts = [port.device, ' - ', port.description]
+            if port.vid and port.pid:
+                parts += [' (VID: 0x', _HEX4(port.vid), ', PID: 0x', _HEX4(port.pid), ')']
+            if auto_detect:
+                detected = self._PID_INDEX.get((port.vid, port.pid), 'Unknown')
+                parts += [' [', detected, ']']
+            item = QStandardItem(''.join(parts))
+            item.setData(port.device, Qt.UserRole)
+            item.setData(port, _PORT_INFO_ROLE)
+            if auto_detect:
+                item.setData(detected, _DETECTED_TYPE_ROLE)
+            model.setItem(row, 0, item)
+        
+        self.port_combo.setModel(model)
+        self.connect_btn.setEnabled(True)
     
     def filter_ports_by_reader_type(self, ports):
         """Filter ports based on the selected reader type."""
-        if self.current_reader_type == 'Auto-Detect':
-            # Return all ports for auto-detect
-            return ports
-        
-        if self.current_reader_type not in self.READER_TYPES:
-            return ports
-        
-        config = self.READER_TYPES[self.current_reader_type]
-        if not config['vid_pid']:
-            # No specific VID:PID filtering needed
-            return ports
+        config = self.READER_TYPES.get(self.current_reader_type)
+        ids = config.vid_pid if config else None
+        if not ids:
+            # Auto-detect, unknown reader type or no specific VID:PID filtering;
+            # only drop Bluetooth virtual ports unless the user asked for them
+            if self.show_virtual_check.isChecked():
+                return ports
+            return [port for port in ports if not _is_bluetooth_port(port)]
         
         # Filter by VID:PID
-        filtered_ports = []
-        for port in ports:
-            if port.vid and port.pid:
-                for vid, pid in config['vid_pid']:
-                    if port.vid == vid and port.pid == pid:
-                        filtered_ports.append(port)
-                        break
-        
-        return filtered_ports
+        return [port for port in ports if port.vid is not None and (port.vid, port.pid) in ids]
     
     @Slot()
     def toggle_connection(self):
@@ -209,34 +417,78 @@ class DevicePanel(QGroupBox):
     
     def connect_device(self):
         """Connect to the selected serial port."""
+        # Only block with dialogs when the user pressed the Connect button;
+        # automatic reconnects report errors in the panel instead.
+        interactive = self.sender() is self.connect_btn
+        
         if self.port_combo.currentIndex() < 0:
-            QMessageBox.warning(self, "Error", "No port selected")
+            self._show_error("Error", "No port selected", interactive)
             return
         
         port = self.port_combo.currentData()
         if not port:
-            QMessageBox.warning(self, "Error", "Invalid port selection")
+            self._show_error("Error", "Invalid port selection", interactive)
             return
         
+        # Reader type identified from the port's VID:PID during the scan
+        self.detected_reader_type = self.port_combo.currentData(_DETECTED_TYPE_ROLE)
+        
+        if self.current_reader_type == 'Auto-Detect':
+            # Resolve the reader from its VID:PID before paying for the open
+            selected_port = self.port_combo.currentData(_PORT_INFO_ROLE)
+            reader_type = None
+            if selected_port is not None:
+                reader_type = self._PID_INDEX.get((selected_port.vid, selected_port.pid))
+            
+            if reader_type:
+                self._set_detected_reader_type(reader_type)
+            elif not interactive:
+                self._show_error("Unknown Device",
+                                 f"{port} does not match any supported reader", False)
+                return
+            else:
+                answer = QMessageBox.question(
+                    self, "Unknown Device",
+                    f"{port} does not match any supported reader.\nConnect anyway?",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+                )
+                if answer != QMessageBox.Yes:
+                    return
+        
+        baudrate = 115200  # Default baudrate, can be made configurable
+        
         try:
-            self.serial_port = serial.Serial(
-                port=port,
-                baudrate=115200,  # Default baudrate, can be made configurable
-                timeout=1
-            )
+            if (self.serial_port is not None and self.serial_port.is_open
+                    and self.serial_port.port == port and self.serial_port.baudrate == baudrate):
+                # Reuse the handle kept open by disconnect_device()
+                self.serial_port.reset_input_buffer()
+                self._rx_buf.clear()
+            else:
+                self.close_port()
+                self.serial_port = serial.Serial(
+                    port=port,
+                    baudrate=baudrate,
+                    # Non-blocking reads (previously timeout=1): read() and
+                    # readline() return at once with whatever has arrived
+                    timeout=0,
+                    write_timeout=0.2,
+                    inter_byte_timeout=0.05
+                )
+                self._rx_buf.clear()
+            self._watch_port()
             self.is_connected = True
+            self._error_timer.stop()
+            self.error_label.clear()
             self.update_ui_connected()
             self.device_connected.emit(True)
             
-            # Update device info
-            selected_port = None
-            for p in serial.tools.list_ports.comports():
-                if p.device == port:
-                    selected_port = p
-                    break
+            # Update device info from the port details captured during the scan
+            selected_port = self.port_combo.currentData(_PORT_INFO_ROLE)
             
             if selected_port:
                 device_info = f"Connected to: {selected_port.description}\n"
+                if self.detected_reader_type:
+                    device_info += f"Detected reader: {self.detected_reader_type}\n"
                 device_info += f"Port: {selected_port.device}\n"
                 if selected_port.manufacturer:
                     device_info += f"Manufacturer: {selected_port.manufacturer}\n"
@@ -250,45 +502,208 @@ class DevicePanel(QGroupBox):
                 self.info_label.setText(device_info)
             
         except Exception as e:
-            QMessageBox.critical(self, "Connection Error", f"Failed to connect to {port}: {str(e)}")
+            self._show_error("Connection Error", f"Failed to connect to {port}: {str(e)}",
+                             interactive, critical=True)
             self.is_connected = False
             self.update_ui_disconnected()
     
+    def _show_error(self, title, message, interactive, critical=False):
+        """Report a connection problem to the user.
+        
+        Args:
+            title: Dialog title used for interactive errors
+            message: Error text
+            interactive: Whether to show a modal dialog instead of the panel label
+            critical: Use a critical dialog rather than a warning
+        """
+        if interactive:
+            if critical:
+                QMessageBox.critical(self, title, message)
+            else:
+                QMessageBox.warning(self, title, message)
+            return
+        
+        logger.warning(f"{title}: {message}")
+        self.error_label.setText(message)
+        self._error_timer.start()
+    
+    def _set_detected_reader_type(self, reader_type):
+        """Switch from Auto-Detect to the reader type matched by VID:PID.
+        
+        Args:
+            reader_type: Key of READER_TYPES identified for the selected port
+        """
+        self.current_reader_type = reader_type
+        
+        # Keep the selector in sync without triggering another port scan
+        index = self.reader_combo.findData(reader_type)
+        if index >= 0:
+            with QSignalBlocker(self.reader_combo):
+                self.reader_combo.setCurrentIndex(index)
+        self.update_reader_info()
+        
+        logger.info(f"Auto-detected reader type: {reader_type}")
+        self.reader_type_changed.emit(reader_type)
+    
+    def start_receiving(self):
+        """Buffer incoming data as it arrives, for read_line()/readlines_available().
+        
+        Only call this when the panel is the port's sole reader: while the NFC
+        thread has the port open through nfcpy, the notifier would take its
+        bytes.
+        """
+        self._receiving = True
+        self._watch_port()
+    
+    def stop_receiving(self):
+        """Stop watching the port for incoming data."""
+        self._receiving = False
+        self._unwatch_port()
+    
+    def _watch_port(self):
+        """Install the read notifier if receiving was requested.
+        
+        Lets the event loop tell us when data arrives instead of polling.
+        pyserial only exposes a pollable descriptor on POSIX; on Windows
+        callers keep using read_line()/readlines_available().
+        """
+        if (self._receiving and self._notifier is None and os.name == 'posix'
+                and self.is_connected and self.serial_port and self.serial_port.is_open):
+            self._notifier = QSocketNotifier(self.serial_port.fileno(), QSocketNotifier.Read, self)
+            self._notifier.activated.connect(self._drain)
+    
+    def _unwatch_port(self):
+        """Remove the read notifier, if any."""
+        if self._notifier is not None:
+            # Must stop watching the descriptor before it is closed
+            self._notifier.setEnabled(False)
+            self._notifier.deleteLater()
+            self._notifier = None
+    
+    def _drain(self):
+        """Move any bytes waiting on the serial port into the receive buffer.
+        
+        Never blocks: everything already received is fetched in one read
+        instead of byte by byte. Only the newest RX_BUFFER_LIMIT bytes are
+        kept. A read error (e.g. the device was unplugged) disconnects.
+        """
+        if not (self.serial_port and self.serial_port.is_open):
+            return
+        try:
+            n = max(1, self.serial_port.in_waiting)
+            self._rx_buf += self.serial_port.read(n)
+        except (OSError, serial.SerialException) as e:
+            # A hung-up descriptor stays readable; stop watching it at once
+            # so the event loop does not spin on the error
+            logger.warning(f"Serial port read failed, disconnecting: {e}")
+            self._unwatch_port()
+            self.disconnect_device()
+            self.close_port()
+            return
+        if len(self._rx_buf) > self.RX_BUFFER_LIMIT:
+            del self._rx_buf[:-self.RX_BUFFER_LIMIT]
+    
+    def readlines_available(self):
+        """Return all complete lines received so far.
+        
+        Any trailing partial line is kept in the buffer for the next call.
+        
+        Returns:
+            list: Complete lines as bytes, without their terminators
+        """
+        self._drain()
+        *lines, tail = self._rx_buf.split(b'\n')
+        self._rx_buf = bytearray(tail)
+        return [bytes(line) for line in lines]
+    
+    def read_line(self):
+        """Return the next complete line received from the serial port.
+        
+        Never waits: if no full line has arrived yet, None is returned and the
+        partial data stays buffered. Call again when more data is expected.
+        
+        Returns:
+            bytes or None: The line including its terminator, or None
+        """
+        self._drain()
+        end = self._rx_buf.find(b'\n')
+        if end < 0:
+            return None
+        line = bytes(self._rx_buf[:end + 1])
+        del self._rx_buf[:end + 1]
+        return line
+    
     def disconnect_device(self):
-        """Disconnect from the current serial port."""
-        if self.serial_port and self.serial_port.is_open:
+        """Disconnect from the current serial port.
+        
+        The port handle itself stays open so that reconnecting to the same
+        port does not pay the open/reset cost again. It is released when
+        another port or reader type is selected, and by release_idle_port()
+        or close_port().
+        """
+        if self._persistent and self.serial_port and self.serial_port.is_open:
+            self._unwatch_port()
             try:
-                self.serial_port.close()
+                self.serial_port.flush()
             except Exception as e:
-                logging.error(f"Error closing serial port: {str(e)}")
+                logger.error(f"Error flushing serial port: {str(e)}")
+        else:
+            self.close_port()
         
-        self.serial_port = None
         self.is_connected = False
+        self.detected_reader_type = None
         self.update_ui_disconnected()
         self.device_connected.emit(False)
         self.info_label.setText("No device connected")
     
+    def release_idle_port(self):
+        """Close the handle kept open after a disconnect.
+        
+        Call this before anything else (the NFC thread, diagnostics) opens the
+        port: serial ports are exclusive on Windows, and on POSIX a second
+        reader would split the incoming data with the idle handle.
+        """
+        if not self.is_connected:
+            self.close_port()
+    
+    def _release_stale_port(self, *args):
+        """Release the idle handle once a different port is selected."""
+        if (not self.is_connected and self.serial_port is not None
+                and self.serial_port.port != self.port_combo.currentData()):
+            self.close_port()
+    
+    def close_port(self):
+        """Close the serial port handle, if one is open."""
+        self._unwatch_port()
+        
+        if self.serial_port and self.serial_port.is_open:
+            try:
+                self.serial_port.close()
+            except Exception as e:
+                logger.error(f"Error closing serial port: {str(e)}")
+        
+        self.serial_port = None
+    
     def update_device_info(self):
         """Update the device information display."""
         if self.is_connected and self.serial_port:
             # Get current port info
             port_name = self.serial_port.port
             try:
-                for port in serial.tools.list_ports.comports():
-                    if port.device == port_name:
-                        device_info = f"Device: {port.description}\n"
-                        device_info += f"Port: {port.device}\n"
-                        if port.manufacturer:
-                            device_info += f"Manufacturer: {port.manufacturer}\n"
-                        if port.product:
-                            device_info += f"Product: {port.product}\n"
-                        if port.vid and port.pid:
-                            device_info += f"VID: 0x{port.vid:04x}, PID: 0x{port.pid:04x}\n"
-                        if port.serial_number:
-                            device_info += f"Serial: {port.serial_number}"
-                        
-                        self.info_label.setText(device_info)
-                        break
+                port = self.port_combo.currentData(_PORT_INFO_ROLE)
+                if port is not None and port.device == port_name:
+                    device_info = f"Device: {port.description}\n"
+                    device_info += f"Port: {port.device}\n"
+                    if port.manufacturer:
+                        device_info += f"Manufacturer: {port.manufacturer}\n"
+                    if port.product:
+                        device_info += f"Product: {port.product}\n"
+                    if port.vid and port.pid:
+                        device_info += f"VID: 0x{port.vid:04x}, PID: 0x{port.pid:04x}\n"
+                    if port.serial_number:
+                        device_info += f"Serial: {port.serial_number}"
+                    
+                    self.info_label.setText(device_info)
             except Exception as e:
                 self.info_label.setText(f"Connected to {port_name}\nError getting device info: {str(e)}")
         else:
@@ -297,33 +712,55 @@ class DevicePanel(QGroupBox):
     def update_ui_connected(self):
         """Update UI when device is connected."""
         self.status_label.setText("Status: Connected")
-        self.status_label.setStyleSheet("color: green; font-weight: bold;")
+        self._set_status_state('ok')
         self.connect_btn.setText("Disconnect")
         self.port_combo.setEnabled(False)
         self.reader_combo.setEnabled(False)
         self.refresh_btn.setEnabled(False)
+        self.show_virtual_check.setEnabled(False)
     
     def update_ui_disconnected(self):
         """Update UI when device is disconnected."""
         self.status_label.setText("Status: Disconnected")
-        self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        self._set_status_state('bad')
         self.connect_btn.setText("Connect")
         self.port_combo.setEnabled(True)
         self.reader_combo.setEnabled(True)
         self.refresh_btn.setEnabled(True)
+        self.show_virtual_check.setEnabled(True)
+    
+    def _set_status_state(self, state):
+        """Switch the status label between its 'ok' and 'bad' styles.
+        
+        Args:
+            state: Value of the label's 'state' property used by _STATUS_QSS
+        """
+        if self.status_label.property('state') == state:
+            return
+        self.status_label.setProperty('state', state)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
     
     def closeEvent(self, event):
         """Handle window close event."""
-        self.disconnect_device()
+        if self.is_connected:
+            self.disconnect_device()
+        self.close_port()
         super().closeEvent(event)
     
     def get_serial_connection(self):
         """Get the active serial connection.
         
+        The port is opened with timeout=0, so read()/readline() on the
+        returned handle never wait: they return only the bytes that have
+        already arrived (possibly none). Use read_line() or
+        readlines_available() to assemble lines across calls.
+        
         Returns:
             serial.Serial or None: The active serial connection or None if not connected.
         """
-        return self.serial_port
+        return self.serial_port if self.is_connected else None
     
     def get_selected_reader_type(self):
         """Get the currently selected reader type.
@@ -337,6 +774,6 @@ class DevicePanel(QGroupBox):
         """Get the configuration for the selected reader type.
         
         Returns:
-            dict: The reader configuration or None if not found.
+            ReaderConfig: The reader configuration or None if not found.
         """
         return self.READER_TYPES.get(self.current_reader_type)
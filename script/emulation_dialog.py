@@ -8,10 +8,106 @@ from PySide6.QtWidgets import (
     QPushButton, QGroupBox, QFormLayout, QLineEdit, QTextEdit,
     QCheckBox, QSpinBox, QMessageBox, QTabWidget, QWidget
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
+from PySide6.QtGui import QFont, QTextCursor, QStandardItem, QStandardItemModel
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse user JSON with orjson when available; its JSONDecodeError subclasses
+# json.JSONDecodeError, so one except clause covers both
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_pretty(data) -> str:
+    """Pretty-print data as JSON with a two-space indent."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+# Combo box entries, shared by every dialog instance: (label, id sent with
+# the emulation request)
+_TAG_TYPE_ITEMS = (
+    ("Type 1 Tag", "type1tag"),
+    ("Type 2 Tag", "type2tag"),
+    ("Type 3 Tag", "type3tag"),
+    ("Type 4 Tag", "type4tag"),
+    ("MIFARE Classic", "mifareclassic"),
+    ("MIFARE Ultralight", "mifareultralight")
+)
+
+_ENCODING_ITEMS = (
+    ("UTF-8", "utf-8"),
+    ("UTF-16 (Big Endian)", "utf-16-be"),
+    ("UTF-16 (Little Endian)", "utf-16-le"),
+    ("ISO-8859-1 (Latin-1)", "iso-8859-1"),
+    ("ASCII", "ascii"),
+    ("Windows-1252", "windows-1252"),
+    ("Shift-JIS", "shift-jis"),
+    ("EUC-JP", "euc-jp"),
+    ("GBK (Simplified Chinese)", "gbk"),
+    ("Big5 (Traditional Chinese)", "big5"),
+    ("EUC-KR (Korean)", "euc-kr"),
+    ("KOI8-R (Cyrillic)", "koi8-r"),
+    ("ISO-8859-2 (Latin-2)", "iso-8859-2"),
+    ("ISO-8859-5 (Cyrillic)", "iso-8859-5"),
+    ("ISO-8859-7 (Greek)", "iso-8859-7"),
+    ("ISO-8859-8 (Hebrew)", "iso-8859-8"),
+    ("ISO-8859-9 (Turkish)", "iso-8859-9"),
+    ("ISO-8859-15 (Latin-9)", "iso-8859-15")
+)
+
+_URI_TYPE_ITEMS = (
+    "http://www.",
+    "https://www.",
+    "http://",
+    "https://",
+    "tel:",
+    "mailto:",
+    "sms:",
+    "smsto:",
+    "geo:",
+    "nfc:",
+    "urn:",
+    "custom"
+)
+
+# Smart poster actions: (label, action sent with the NDEF data)
+_ACTION_ITEMS = (
+    ("Default Action", None),
+    ("Open for Editing", "edit"),
+    ("Open for Viewing", "view"),
+    ("Execute/Launch", "exec"),
+    ("Open Browser", "browse")
+)
+
+# Item models built on first use (a QApplication must exist) and then shared
+# by the combo boxes of every dialog; the selection stays per combo box
+_SHARED_MODELS = {}
+
+
+def _shared_model(items):
+    """Return the shared item model holding the given combo box entries.
+    
+    Entries are (label, id) pairs, with the id stored as item data, or plain
+    labels without data.
+    """
+    model = _SHARED_MODELS.get(items)
+    if model is None:
+        model = _SHARED_MODELS[items] = QStandardItemModel(len(items), 1)
+        for row, entry in enumerate(items):
+            if isinstance(entry, tuple):
+                item = QStandardItem(entry[0])
+                item.setData(entry[1], Qt.UserRole)
+            else:
+                item = QStandardItem(entry)
+            model.setItem(row, 0, item)
+    return model
+
+
 class EmulationDialog(QDialog):
     """Dialog for configuring and controlling NFC tag emulation."""
     
@@ -21,6 +117,12 @@ class EmulationDialog(QDialog):
     # Signal emitted when emulation should stop
     stop_emulation = Signal()
     
+    # Parsed once; the 'state' property selects the emulating style
+    _STATUS_QSS = (
+        "QLabel { font-weight: bold; }"
+        "QLabel[state='emulating'] { color: green; }"
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("NFC Tag Emulation")
@@ -42,26 +144,30 @@ class EmulationDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Text tab
+        # Tab pages; only the Text tab is filled in now, the others are
+        # built the first time they are shown (see _ensure_tab_built)
         self.text_tab = QWidget()
-        self.setup_text_tab()
         self.tab_widget.addTab(self.text_tab, "Text")
         
-        # URI tab
         self.uri_tab = QWidget()
-        self.setup_uri_tab()
         self.tab_widget.addTab(self.uri_tab, "URI")
         
-        # Smart Poster tab
         self.smart_poster_tab = QWidget()
-        self.setup_smart_poster_tab()
         self.tab_widget.addTab(self.smart_poster_tab, "Smart Poster")
         
-        # Raw NDEF tab
         self.raw_tab = QWidget()
-        self.setup_raw_tab()
         self.tab_widget.addTab(self.raw_tab, "Raw NDEF")
         
+        self._tab_builders = (
+            self.setup_text_tab,
+            self.setup_uri_tab,
+            self.setup_smart_poster_tab,
+            self.setup_raw_tab,
+        )
+        self._built_tabs = set()
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        
         layout.addWidget(self.tab_widget)
         
         # Tag type selection
@@ -69,15 +175,9 @@ class EmulationDialog(QDialog):
         tag_type_layout = QHBoxLayout()
         
         self.tag_type_combo = QComboBox()
-        self.tag_type_combo.addItems([
-            "Type 1 Tag",
-            "Type 2 Tag",
-            "Type 3 Tag",
-            "Type 4 Tag",
-            "MIFARE Classic",
-            "MIFARE Ultralight"
-        ])
-        self.tag_type_combo.setCurrentText("Type 4 Tag")
+        self.tag_type_combo.setModel(_shared_model(_TAG_TYPE_ITEMS))
+        with QSignalBlocker(self.tag_type_combo):
+            self.tag_type_combo.setCurrentText("Type 4 Tag")
         
         tag_type_layout.addWidget(QLabel("Emulate as:"))
         tag_type_layout.addWidget(self.tag_type_combo)
@@ -88,7 +188,7 @@ class EmulationDialog(QDialog):
         
         # Status display
         self.status_label = QLabel("Status: Ready")
-        self.status_label.setStyleSheet("font-weight: bold;")
+        self.status_label.setStyleSheet(self._STATUS_QSS)
         layout.addWidget(self.status_label)
         
         # Buttons
@@ -111,6 +211,13 @@ class EmulationDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _ensure_tab_built(self, index):
+        """Build the contents of a tab page the first time it is needed."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        self._tab_builders[index]()
+    
     def setup_text_tab(self):
         """Set up the text tab."""
         layout = QVBoxLayout()
@@ -125,27 +232,9 @@ class EmulationDialog(QDialog):
         encoding_layout.addWidget(QLabel("Encoding:"))
         
         self.encoding_combo = QComboBox()
-        self.encoding_combo.addItems([
-            "UTF-8",
-            "UTF-16 (Big Endian)",
-            "UTF-16 (Little Endian)",
-            "ISO-8859-1 (Latin-1)",
-            "ASCII",
-            "Windows-1252",
-            "Shift-JIS",
-            "EUC-JP",
-            "GBK (Simplified Chinese)",
-            "Big5 (Traditional Chinese)",
-            "EUC-KR (Korean)",
-            "KOI8-R (Cyrillic)",
-            "ISO-8859-2 (Latin-2)",
-            "ISO-8859-5 (Cyrillic)",
-            "ISO-8859-7 (Greek)",
-            "ISO-8859-8 (Hebrew)",
-            "ISO-8859-9 (Turkish)",
-            "ISO-8859-15 (Latin-9)"
-        ])
-        self.encoding_combo.setCurrentText("UTF-8")
+        self.encoding_combo.setModel(_shared_model(_ENCODING_ITEMS))
+        with QSignalBlocker(self.encoding_combo):
+            self.encoding_combo.setCurrentText("UTF-8")
         
         encoding_layout.addWidget(self.encoding_combo)
         encoding_layout.addStretch()
@@ -165,21 +254,9 @@ class EmulationDialog(QDialog):
         
         # URI type
         self.uri_type_combo = QComboBox()
-        self.uri_type_combo.addItems([
-            "http://www.",
-            "https://www.",
-            "http://",
-            "https://",
-            "tel:",
-            "mailto:",
-            "sms:",
-            "smsto:",
-            "geo:",
-            "nfc:",
-            "urn:",
-            "custom"
-        ])
-        self.uri_type_combo.setCurrentText("https://www.")
+        self.uri_type_combo.setModel(_shared_model(_URI_TYPE_ITEMS))
+        with QSignalBlocker(self.uri_type_combo):
+            self.uri_type_combo.setCurrentText("https://www.")
         
         layout.addRow("URI Type:", self.uri_type_combo)
         layout.addRow("URI:", self.uri_input)
@@ -190,8 +267,16 @@ class EmulationDialog(QDialog):
         self.custom_uri_type.setVisible(False)
         layout.addRow("", self.custom_uri_type)
         
+        # URI with its type prefix, computed when editing finishes and
+        # dropped whenever one of its inputs changes
+        self._canonical_uri = None
+        
         # Connect signals
         self.uri_type_combo.currentTextChanged.connect(self.on_uri_type_changed)
+        self.uri_input.editingFinished.connect(self._canonicalize_uri)
+        self.custom_uri_type.editingFinished.connect(self._canonicalize_uri)
+        self.uri_input.textChanged.connect(self._invalidate_canonical_uri)
+        self.custom_uri_type.textChanged.connect(self._invalidate_canonical_uri)
         
         self.uri_tab.setLayout(layout)
     
@@ -209,13 +294,8 @@ class EmulationDialog(QDialog):
         
         # Action
         self.action_combo = QComboBox()
-        self.action_combo.addItems([
-            "Default Action",
-            "Open for Editing",
-            "Open for Viewing",
-            "Execute/Launch",
-            "Open Browser"
-        ])
+        for label, action in _ACTION_ITEMS:
+            self.action_combo.addItem(label, action)
         
         # Language
         self.language_input = QLineEdit("en")
@@ -260,6 +340,30 @@ class EmulationDialog(QDialog):
     def on_uri_type_changed(self, text):
         """Handle changes to the URI type combo box."""
         self.custom_uri_type.setVisible(text == "custom")
+        self._canonicalize_uri()
+    
+    def _invalidate_canonical_uri(self):
+        """Forget the canonical URI after the URI or its type was edited."""
+        self._canonical_uri = None
+    
+    def _canonicalize_uri(self):
+        """Compute the URI to emulate, adding the selected type prefix if missing.
+        
+        Returns:
+            str: The canonical URI, or an empty string if no URI was entered
+        """
+        uri = self.uri_input.text().strip()
+        if uri:
+            uri_type = self.uri_type_combo.currentText()
+            if uri_type == "custom":
+                uri_type = self.custom_uri_type.text().strip()
+            
+            # Add the URI type if not already present
+            if not uri.startswith(uri_type):
+                uri = uri_type + uri
+        
+        self._canonical_uri = uri
+        return uri
     
     def format_json(self):
         """Format the JSON in the raw NDEF input."""
@@ -268,10 +372,11 @@ class EmulationDialog(QDialog):
             if not text:
                 return
                 
-            # Parse and pretty-print JSON
-            data = json.loads(text)
-            formatted = json.dumps(data, indent=2)
-            self.raw_ndef_input.setPlainText(formatted)
+            # Parse once and serialize once (in C when orjson is available)
+            formatted = _dumps_pretty(_loads(text))
+            # Already formatted: skip the re-layout and the extra undo step
+            if formatted != text:
+                self.raw_ndef_input.setPlainText(formatted)
         except json.JSONDecodeError as e:
             QMessageBox.warning(
                 self,
@@ -294,7 +399,7 @@ class EmulationDialog(QDialog):
                     QMessageBox.warning(self, "Error", "Please enter some text to emulate.")
                     return
                 
-                encoding = self.encoding_combo.currentText().split()[0].lower()  # Get encoding name
+                encoding = self.encoding_combo.currentData()
                 ndef_data = {
                     "type": "text",
                     "text": text,
@@ -302,19 +407,13 @@ class EmulationDialog(QDialog):
                 }
                 
             elif tab_index == 1:  # URI tab
-                uri = self.uri_input.text().strip()
+                uri = self._canonical_uri
+                if uri is None:
+                    uri = self._canonicalize_uri()
                 if not uri:
                     QMessageBox.warning(self, "Error", "Please enter a URI to emulate.")
                     return
                 
-                uri_type = self.uri_type_combo.currentText()
-                if uri_type == "custom":
-                    uri_type = self.custom_uri_type.text().strip()
-                
-                # Add the URI type if not already present
-                if not uri.startswith(uri_type):
-                    uri = uri_type + uri
-                
                 ndef_data = {
                     "type": "uri",
                     "uri": uri
@@ -332,15 +431,7 @@ class EmulationDialog(QDialog):
                     )
                     return
                 
-                action_map = {
-                    "Default Action": None,
-                    "Open for Editing": "edit",
-                    "Open for Viewing": "view",
-                    "Execute/Launch": "exec",
-                    "Open Browser": "browse"
-                }
-                
-                action = action_map.get(self.action_combo.currentText())
+                action = self.action_combo.currentData()
                 language = self.language_input.text().strip() or "en"
                 
                 ndef_data = {
@@ -358,7 +449,7 @@ class EmulationDialog(QDialog):
                     return
                 
                 try:
-                    ndef_data = json.loads(raw_text)
+                    ndef_data = _loads(raw_text)
                     if not isinstance(ndef_data, list):
                         ndef_data = [ndef_data]
                 except json.JSONDecodeError as e:
@@ -371,7 +462,7 @@ class EmulationDialog(QDialog):
             
             if ndef_data is not None:
                 # Get the selected tag type
-                tag_type = self.tag_type_combo.currentText().lower().replace(" ", "")
+                tag_type = self.tag_type_combo.currentData()
                 
                 # Emit the start signal with the NDEF data and tag type
                 self.start_emulation.emit(ndef_data, tag_type)
@@ -381,7 +472,7 @@ class EmulationDialog(QDialog):
                 self.start_button.setEnabled(False)
                 self.stop_button.setEnabled(True)
                 self.status_label.setText("Status: Emulating tag...")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+                self._set_status_state('emulating')
                 
         except Exception as e:
             QMessageBox.critical(
@@ -397,7 +488,20 @@ class EmulationDialog(QDialog):
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.status_label.setText("Status: Ready")
-        self.status_label.setStyleSheet("font-weight: bold;")
+        self._set_status_state('')
+    
+    def _set_status_state(self, state):
+        """Switch the status label style via its 'state' property.
+        
+        Args:
+            state: 'emulating', or an empty string for the default style
+        """
+        if self.status_label.property('state') == state:
+            return
+        self.status_label.setProperty('state', state)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
     
     def closeEvent(self, event):
         """Handle dialog close event."""
@@ -5,7 +5,23 @@ This module provides utilities for handling different character encodings
 when reading from and writing to NFC tags.
 """
 import codecs
-from typing import Optional, Tuple, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Tuple, Mapping
+
+try:
+    import simdutf
+except ImportError:  # Optional: fall back to CPython's codecs
+    simdutf = None
+
+# SIMD UTF-8 validation from simdutf, when the binding provides it
+_validate_utf8 = getattr(simdutf, 'validate_utf8', None)
+
+# Unicode encodings that can represent any text except lone surrogates
+_UTF_ENCODINGS = frozenset({
+    'utf-8', 'utf8', 'utf-16', 'utf16', 'utf-16le', 'utf-16-le',
+    'utf-16be', 'utf-16-be', 'utf-32', 'utf-32le', 'utf-32be'
+})
 
 # Common encodings supported by NFC tags
 SUPPORTED_ENCODINGS = {
@@ -30,6 +46,27 @@ SUPPORTED_ENCODINGS = {
     'iso-8859-15': 'ISO-8859-15 (Latin-9)'
 }
 
+# Read-only view returned by get_supported_encodings(), built once
+_SUPPORTED_LIST = tuple(
+    MappingProxyType({'id': k, 'name': v}) for k, v in SUPPORTED_ENCODINGS.items()
+)
+
+@lru_cache(maxsize=32)
+def _codec(name: str) -> codecs.CodecInfo:
+    """
+    Look up a codec once and reuse it for later calls.
+    
+    Args:
+        name: Lower-case encoding name
+        
+    Returns:
+        The CodecInfo for the encoding
+        
+    Raises:
+        LookupError: If the encoding is unknown (not cached)
+    """
+    return codecs.lookup(name)
+
 def detect_encoding(data: bytes, default: str = 'utf-8') -> str:
     """
     Attempt to detect the encoding of the given bytes.
@@ -41,37 +78,48 @@ def detect_encoding(data: bytes, default: str = 'utf-8') -> str:
     Returns:
         Detected or default encoding name
     """
-    # Try UTF-8 first (most common for NFC)
+    # Byte order marks identify the encoding without looking further
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8'
+    if data.startswith(codecs.BOM_UTF16_LE):
+        return 'utf-16-le'
+    if data.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16-be'
+    
+    # Pure ASCII is valid UTF-8 (most common for NFC); checked without decoding
+    if data.isascii():
+        return 'utf-8'
+    
+    if _validate_utf8 is not None:
+        # Validates without building a throwaway str
+        try:
+            if _validate_utf8(data):
+                return 'utf-8'
+        except Exception:
+            pass
+        else:
+            return 'latin-1'
+    
     try:
         data.decode('utf-8')
         return 'utf-8'
     except UnicodeDecodeError:
         pass
     
-    # Try UTF-16 with BOM
-    if len(data) >= 2:
-        if data.startswith(codecs.BOM_UTF16_LE):
-            return 'utf-16-le'
-        elif data.startswith(codecs.BOM_UTF16_BE):
-            return 'utf-16-be'
-    
-    # Try other common encodings
-    for encoding in ['latin-1', 'cp1252', 'ascii']:
-        try:
-            data.decode(encoding)
-            return encoding
-        except UnicodeDecodeError:
-            continue
-    
-    return default
+    # Latin-1 maps every byte value, so probing it (or the other single-byte
+    # codecs tried before it) cannot fail; use it for anything else
+    return 'latin-1'
 
-def decode_data(data: bytes, encoding: Optional[str] = None) -> Tuple[str, str]:
+def decode_data(data: bytes, encoding: Optional[str] = None,
+                max_bytes: Optional[int] = None) -> Tuple[str, str]:
     """
     Decode bytes to text using the specified or detected encoding.
     
     Args:
         data: The bytes to decode
         encoding: Optional encoding to use (None for auto-detect)
+        max_bytes: Only decode this many leading bytes, e.g. for a preview;
+            a character cut off at the limit is dropped
         
     Returns:
         Tuple of (decoded_text, used_encoding)
@@ -82,8 +130,17 @@ def decode_data(data: bytes, encoding: Optional[str] = None) -> Tuple[str, str]:
     if not encoding or encoding.lower() == 'auto':
         encoding = detect_encoding(data)
     
+    truncated = max_bytes is not None and len(data) > max_bytes
+    if truncated:
+        data = data[:max_bytes]
+    
     try:
-        return data.decode(encoding, errors='replace'), encoding
+        codec = _codec(encoding.lower())
+        if truncated:
+            # Not final, so an incomplete trailing sequence is held back
+            # instead of being turned into a replacement character
+            return codec.incrementaldecoder('replace').decode(data, final=False), encoding
+        return codec.decode(data, 'replace')[0], encoding
     except Exception:
         # Fallback to latin-1 which can decode any byte sequence
         return data.decode('latin-1', errors='replace'), 'latin-1'
@@ -103,7 +160,7 @@ def encode_data(text: str, encoding: str = 'utf-8') -> bytes:
         return b''
     
     try:
-        return text.encode(encoding, errors='replace')
+        return _codec(encoding.lower()).encode(text, 'replace')[0]
     except Exception:
         # Fallback to utf-8 with replacement
         return text.encode('utf-8', errors='replace')
@@ -118,7 +175,11 @@ def get_encoding_name(encoding: str) -> str:
     Returns:
         Human-readable encoding name
     """
-    return SUPPORTED_ENCODINGS.get(encoding.lower(), encoding.upper())
+    # Keys are lower-case already, so most lookups need no normalization
+    name = SUPPORTED_ENCODINGS.get(encoding)
+    if name is None:
+        name = SUPPORTED_ENCODINGS.get(encoding.lower(), encoding.upper())
+    return name
 
 def convert_encoding(text: str, from_encoding: str, to_encoding: str) -> str:
     """
@@ -135,19 +196,52 @@ def convert_encoding(text: str, from_encoding: str, to_encoding: str) -> str:
     Raises:
         UnicodeError: If conversion fails
     """
+    decoded = text if isinstance(text, str) else _decode_source(text, from_encoding, to_encoding)
+    encoded = convert_encoding_bytes(decoded, from_encoding, to_encoding)
+    if to_encoding.lower() in _UTF_ENCODINGS:
+        # Unicode round-trips are lossless, so the text is already the result
+        return decoded
+    try:
+        return encoded.decode(to_encoding)
+    except UnicodeDecodeError as e:
+        raise UnicodeError(f"Failed to convert from {from_encoding} to {to_encoding}: {str(e)}")
+
+def convert_encoding_bytes(text: str, from_encoding: str, to_encoding: str) -> bytes:
+    """
+    Convert text to bytes in the target encoding, e.g. for writing to a tag.
+    
+    Unlike convert_encoding, the result is not decoded back into a string.
+    
+    Args:
+        text: The text (or bytes in from_encoding) to convert
+        from_encoding: Source encoding
+        to_encoding: Target encoding
+        
+    Returns:
+        The text encoded with to_encoding
+        
+    Raises:
+        UnicodeError: If conversion fails
+    """
+    if not isinstance(text, str):
+        text = _decode_source(text, from_encoding, to_encoding)
+    try:
+        return text.encode(to_encoding)
+    except UnicodeEncodeError as e:
+        raise UnicodeError(f"Failed to convert from {from_encoding} to {to_encoding}: {str(e)}")
+
+def _decode_source(data: bytes, from_encoding: str, to_encoding: str) -> str:
+    """Decode source bytes for a conversion, reporting failures as UnicodeError."""
     try:
-        # First decode from source encoding to unicode
-        decoded = text if isinstance(text, str) else text.decode(from_encoding)
-        # Then encode to target encoding and back to unicode to ensure it's valid
-        return decoded.encode(to_encoding).decode(to_encoding)
-    except (UnicodeEncodeError, UnicodeDecodeError) as e:
+        return data.decode(from_encoding)
+    except UnicodeDecodeError as e:
         raise UnicodeError(f"Failed to convert from {from_encoding} to {to_encoding}: {str(e)}")
 
-def get_supported_encodings() -> List[Dict[str, str]]:
+def get_supported_encodings() -> Tuple[Mapping[str, str], ...]:
     """
-    Get a list of supported encodings with their display names.
+    Get the supported encodings with their display names.
     
     Returns:
-        List of dicts with 'id' and 'name' keys
+        Tuple of read-only mappings with 'id' and 'name' keys
     """
-    return [{'id': k, 'name': v} for k, v in SUPPORTED_ENCODINGS.items()]
+    return _SUPPORTED_LIST
@@ -2,12 +2,115 @@
 Logging configuration for the NFC application.
 """
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+class FastFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once.
+    
+    The date format has one-second resolution, so records logged within the
+    same second reuse the cached string instead of calling strftime again.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, cached_text = self._last_time
+        if second != cached_second:
+            cached_text = time.strftime(datefmt or self.default_time_format,
+                                        self.converter(second))
+            self._last_time = (second, cached_text)
+        return cached_text
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes records in batches.
+    
+    Records are buffered and written with a single flush once `capacity`
+    records are pending, an ERROR (or worse) is logged, or `flush_interval`
+    seconds have passed since the first buffered record.
+    """
+    
+    def __init__(self, *args, capacity=256, flush_interval=1.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._timer = None
+    
+    def emit(self, record):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.capacity or record.levelno >= logging.ERROR:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            records, self._buffer = self._buffer, []
+            for record in records:
+                try:
+                    if self.shouldRollover(record):
+                        self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self.stream.write(self.format(record) + self.terminator)
+                except Exception:
+                    self.handleError(record)
+            if self.stream is not None and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.flush()
+        super().close()
+
+# Listener and root queue handler installed by the last setup_logging() call
+_listener = None
+_queue_handler = None
+
+def _stop_listener():
+    """Detach the queue handler and stop the listener, flushing queued records."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def setup_logging():
-    """Configure logging to file and console."""
+    """Configure logging to file and console.
+    
+    Records are handed to a queue on the calling thread and written by a
+    background QueueListener, so logging never blocks on file or console I/O.
+    Calling it again replaces the previous listener instead of adding a
+    second queue handler; the listener is stopped automatically at exit.
+    
+    Returns:
+        logging.Logger: This module's logger
+    """
+    global _listener, _queue_handler
+    
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -19,23 +122,42 @@ def setup_logging():
     # Define log format
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
+    formatter = FastFormatter(log_format, date_format)
     
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.INFO,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
+    # The real handlers run on the listener thread; the file is only created
+    # once something is written and is rotated at 5 MB
+    file_handler = _BufferedRotatingFileHandler(
+        log_file, maxBytes=5 * 1024 * 1024, backupCount=5,
+        encoding='utf-8', delay=True
     )
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # Records still queued for a previous listener are written out first
+    _stop_listener()
+    
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    
+    # Configure root logger; the queue handler keeps the default formatter so
+    # the message is only formatted once, by the listener's handlers
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    
+    _listener.start()
     
     # Set log level for external libraries
     logging.getLogger('PIL').setLevel(logging.WARNING)
     logging.getLogger('matplotlib').setLevel(logging.WARNING)
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging initialized. Log file: {log_file.absolute()}")
+    # Pass arguments instead of pre-formatting so nothing is built for
+    # filtered records; use the same style in hot paths
+    logger.info("Logging initialized. Log file: %s", log_file.absolute())
     
     return logger
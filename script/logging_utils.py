@@ -5,15 +5,130 @@ Logging utilities for NFC Reader/Writer
 """
 
 import os
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 
+from .logging_config import FastFormatter
+
+# Maximum number of records waiting for the listener thread; further records
+# are dropped rather than blocking the thread that logs them
+LOG_QUEUE_SIZE = 10000
+
+# Whether the root logger currently lets DEBUG records through. Hot paths can
+# test it before building debug output: `if logging_utils.DEBUG_ON: ...`
+# (read it through the module; a from-import would keep a stale copy).
+# Updated by setup_logging() and refresh_debug_flag().
+DEBUG_ON = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+# Listener writing queued records, replaced on every setup_logging() call
+_listener = None
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def refresh_debug_flag():
+    """Update DEBUG_ON after the root logger's level was changed."""
+    global DEBUG_ON
+    DEBUG_ON = logging.getLogger().isEnabledFor(logging.DEBUG)
+    return DEBUG_ON
+
+
+def _stop_listener():
+    """Stop the listener thread, writing out any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+class _FdStream:
+    """Minimal append-only file stream on a raw file descriptor.
+    
+    Bytes are collected in a bytearray and written with a single os.write()
+    once `limit` bytes are pending or on flush(), bypassing Python's
+    buffered and text I/O layers.
+    """
+    
+    __slots__ = ('fd', 'buf', 'limit')
+    
+    _FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+    
+    def __init__(self, path, limit):
+        self.fd = os.open(path, self._FLAGS, 0o644)
+        self.buf = bytearray()
+        self.limit = limit
+    
+    def write(self, data):
+        self.buf += data
+        if len(self.buf) >= self.limit:
+            self.flush()
+    
+    def flush(self):
+        if self.buf and self.fd is not None:
+            view = memoryview(self.buf)
+            written = 0
+            try:
+                while written < len(view):
+                    written += os.write(self.fd, view[written:])
+            finally:
+                view.release()
+                del self.buf[:written]
+    
+    def close(self):
+        if self.fd is not None:
+            try:
+                self.flush()
+            finally:
+                os.close(self.fd)
+                self.fd = None
+
 class DailyRotatingFileHandler(logging.FileHandler):
+    """File handler that starts a new dated log file every day.
+    
+    Records are encoded into a 64 KB staging buffer on a raw file descriptor
+    and written with one os.write() per batch; the buffer is written when it
+    fills up, when an ERROR (or worse) is logged, FLUSH_INTERVAL seconds after
+    the first unwritten record, on rollover and on logging shutdown.
+    """
+    
+    # Number of pending bytes that triggers a write to the log file
+    BUFFER_SIZE = 64 * 1024
+    
+    # Longest time (seconds) a record may wait in the buffer
+    FLUSH_INTERVAL = 1.0
+    
+    # Own attributes live in slots; logging.Handler still provides a __dict__
+    __slots__ = ('log_dir', 'base_filename', '_fmt_template', 'current_date',
+                 'current_log_file', '_next_rollover_ts', '_flush_timer')
+    
     def __init__(self, log_dir, base_filename, mode='a', encoding='utf-8', delay=False):
         self.log_dir = Path(log_dir)
         self.base_filename = base_filename
+        # strftime() template for the dated file name ('%' in the base escaped)
+        self._fmt_template = base_filename.replace('%', '%%') + "_%Y%m%d.log"
         self.current_date = datetime.now().date()
+        self._flush_timer = None
         
         # Create logs directory if it doesn't exist
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -24,50 +139,100 @@ class DailyRotatingFileHandler(logging.FileHandler):
         # Initialize the parent class with the current log file
         super().__init__(self.current_log_file, mode, encoding, delay)
     
-    def _get_log_file_name(self, date):
-        """Generate log file name with date."""
-        return self.log_dir / f"{self.base_filename}_{date.strftime('%Y%m%d')}.log"
-    
     def _set_log_file(self):
         """Set the current log file based on the current date."""
         self.current_date = datetime.now().date()
-        self.current_log_file = self._get_log_file_name(self.current_date)
+        # Kept as a plain str: it is only rebuilt here, once per day
+        self.current_log_file = os.path.join(
+            str(self.log_dir), self.current_date.strftime(self._fmt_template)
+        )
+        # Local midnight ending the current day, as a Unix timestamp
+        self._next_rollover_ts = datetime.combine(
+            self.current_date + timedelta(days=1), datetime.min.time()
+        ).timestamp()
     
-    def _should_rollover(self):
-        """Check if we should roll over to a new log file."""
-        return datetime.now().date() > self.current_date
+    def _should_rollover(self, record):
+        """Check if the record belongs in a new day's log file.
+        
+        Uses the record's creation time, so no clock is read per record.
+        """
+        return record.created >= self._next_rollover_ts
+    
+    def _open(self):
+        """Open the current log file for appending on a raw file descriptor."""
+        return _FdStream(self.baseFilename, self.BUFFER_SIZE)
+    
+    def _rollover(self):
+        """Flush and close the current file and switch to today's file."""
+        if self.stream is not None:
+            self.stream.close()  # Flushes the buffer
+            self.stream = None
+        self._set_log_file()
+        self.baseFilename = os.path.abspath(self.current_log_file)
+        self.stream = self._open()
     
     def emit(self, record):
-        """Eit a record, rolling over to a new file if the date has changed."""
-        if self._should_rollover():
-            self.close()
-            self._set_log_file()
-            self.stream = self._open()
-        super().emit(record)
+        """Emit a record, rolling over to a new file if the date has changed."""
+        try:
+            if self._should_rollover(record):
+                self._rollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self.encoding or 'utf-8', 'backslashreplace'))
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        """Write out buffered records and cancel any pending timed flush."""
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            super().flush()
+        finally:
+            self.release()
 
 def setup_logging(log_dir="logs"):
     """
     Configure logging to both console and file with daily log rotation.
     
+    The root logger only gets a queue handler, so logging calls return after
+    an enqueue; a background QueueListener does the console and file I/O.
+    
     Args:
         log_dir (str): Directory to store log files
+        
+    Returns:
+        str: Path of the current log file
     """
-    # Create logs directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
+    global _listener
+    
+    # The log directory is created by DailyRotatingFileHandler
     
     # Configure root logger
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     
-    # Clear any existing handlers
+    # Clear any existing handlers, including a previous listener's
     logger.handlers.clear()
+    _stop_listener()
     
-    # Create formatters
-    console_format = logging.Formatter(
+    # Create formatters; timestamps are formatted once per second
+    console_format = FastFormatter(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%H:%M:%S'
     )
-    file_format = logging.Formatter(
+    file_format = FastFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -84,25 +249,56 @@ def setup_logging(log_dir="logs"):
     )
     file_handler.setFormatter(file_format)
     
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # The real handlers run on the listener thread
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    logger.addHandler(_DroppingQueueHandler(log_queue))
+    refresh_debug_flag()
     
     # Return the path to the current log file
-    return str(file_handler.current_log_file)
+    return file_handler.current_log_file
+
+class _LazyStr:
+    """Defers building a log message until a handler formats the record."""
+    
+    __slots__ = ('fn',)
+    
+    def __init__(self, fn):
+        self.fn = fn
+    
+    def __str__(self):
+        return str(self.fn())
 
-def log_error(error_message, exc_info=None):
-    """Log an error message with optional exception info."""
-    logging.error(error_message, exc_info=exc_info)
 
-def log_info(message):
-    """Log an info message."""
-    logging.info(message)
+def lazy(fn):
+    """Wrap a zero-argument callable whose result is only needed if logged.
+    
+    Example:
+        log_debug("Tag dump: %s", lazy(lambda: json.dumps(tag_data)))
+    """
+    return _LazyStr(fn)
+
+# log_info, log_warning and log_debug take a %-style message plus arguments,
+# which are only formatted when the record is actually emitted:
+#     log_info("Tag %s read in %d ms", uid, elapsed)
 
-def log_warning(message):
-    """Log a warning message."""
-    logging.warning(message)
+# Bound once to the root logger, which setup_logging() configures in place;
+# records also report the caller's location rather than a wrapper's
+_root = logging.getLogger()
+log_info = _root.info
+log_warning = _root.warning
+log_debug = _root.debug
+
+def log_error(error_message, exc_info=None):
+    """Log an error message with optional exception info."""
+    # Keeps exc_info as the second positional argument; stacklevel=2 reports
+    # the caller's location like the bound methods above
+    _root.error(error_message, exc_info=exc_info, stacklevel=2)
 
-def log_debug(message):
-    """Log a debug message."""
-    logging.debug(message)
+def log_debug_lazy(fn):
+    """Log the string returned by fn() at DEBUG level, calling fn only if enabled."""
+    if _root.isEnabledFor(logging.DEBUG):
+        _root.debug(fn())
@@ -1,25 +1,102 @@
 from PySide6 import QtGui, QtWidgets
 from PySide6.QtWidgets import QMenuBar, QMenu, QMessageBox
 from PySide6.QtCore import Slot, Qt
+from functools import cached_property
 import time
-import sys
-import os
 
-# Add the parent directory to the path to import settings_manager
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from script.settings_manager import settings_manager
+# Dialogs, authentication and settings are imported by the methods that use
+# them, so building the menu bar does not load them all at startup
 
-from .help_dialog import HelpDialog
-from .auth import AuthManager, PasswordDialog
+# Shortcuts parsed once and shared by every menu (re)build
+_SC_EXIT = QtGui.QKeySequence("Ctrl+Q")
+_SC_LOCK = QtGui.QKeySequence("Ctrl+L")
+_SC_HELP = QtGui.QKeySequence(Qt.Key_F1)
+_SC_SETTINGS = QtGui.QKeySequence("Ctrl+")
+
+# Session timeout choices: (menu text, minutes; 0 disables the timeout)
+TIMEOUT_OPTIONS = (
+    ("5 minutes", 5),
+    ("15 minutes", 15),
+    ("30 minutes", 30),
+    ("1 hour", 60),
+    ("Never (not recommended)", 0)
+)
 
 class AppMenu:
+    # Menu contents: (text, shortcut, slot, checkable, attribute) per action,
+    # None for a separator. Slots prefixed with "parent." live on the main
+    # window; the attribute, if given, keeps a reference to the action.
+    _FILE_ACTIONS = (
+        ("E&xit", _SC_EXIT, "parent.close", False, None),
+    )
+    
+    _EDIT_ACTIONS = (
+        ("&Clear Log", None, "parent.clear_log", False, None),
+        None,
+        ("Read Mode", None, "toggle_read_write_mode", True, "read_mode_action"),
+    )
+    
+    _VIEW_ACTIONS = (
+        ("&Statistics...", None, "parent.show_statistics", False, None),
+    )
+    
+    _TOOLS_ACTIONS = (
+        ("Tag &Tools...", None, "show_tag_tools", False, None),
+        ("Tag &Database...", None, "show_tag_database", False, None),
+        ("NFC &Diagnostics...", None, "run_diagnostics", False, None),
+        None,
+        ("&Format Tag", None, "format_tag", False, None),
+        None,
+        ("&Emulate Tag...", None, "emulate_tag", False, None),
+        None,
+        ("&Settings...", _SC_SETTINGS, "show_settings", False, None),
+    )
+    
+    _SESSION_ACTIONS = (
+        ("&Lock Session", _SC_LOCK, "parent.lock_application", False, "lock_action"),
+    )
+    
+    _SECURITY_ACTIONS = (
+        None,
+        ("Change &Password...", None, "change_password", False, None),
+        None,
+        ("Password &Recovery...", None, "show_password_recovery", False, None),
+        None,
+        ("Require &Password", None, "toggle_password_protection", True, "require_pw_action"),
+    )
+    
+    _HELP_ACTIONS = (
+        ("&Help", _SC_HELP, "show_help", False, None),
+        None,
+        ("&WIKI", None, "open_wiki", False, None),
+        None,
+        ("&About", None, "show_about", False, None),
+    )
+    
     def __init__(self, parent, nfc_thread):
         self.parent = parent
         self.nfc_thread = nfc_thread
-        self.auth_manager = AuthManager()
         self.menubar = parent.menuBar()
         self.setup_menus()
     
+    @cached_property
+    def auth_manager(self):
+        """Authentication manager, created on first use."""
+        from .auth import AuthManager
+        return AuthManager()
+    
+    @cached_property
+    def nfc_ops(self):
+        """NFC operations shared by the tag dialogs, created on first use."""
+        from .nfc_operations import NfcOperations
+        return NfcOperations()
+    
+    @cached_property
+    def db(self):
+        """Tag database shared by the tag dialogs, opened on first use."""
+        from .tag_database import TagDatabase
+        return TagDatabase()
+    
     def setup_menus(self):
         """Set up all menu items and their actions."""
         self.create_file_menu()
@@ -28,87 +105,53 @@ class AppMenu:
         self.create_tools_menu()
         self.create_security_menu()
         self.create_help_menu()
+    
+    def _add_actions(self, menu, specs):
+        """Add the actions described by an action table to a menu.
+        
+        Args:
+            menu: Menu receiving the actions
+            specs: Entries of (text, shortcut, slot, checkable, attribute) or None
+        """
+        parent = self.parent
+        for spec in specs:
+            if spec is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot, checkable, attribute = spec
+            action = QtGui.QAction(text, parent, checkable=checkable)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            if slot.startswith("parent."):
+                action.triggered.connect(getattr(parent, slot[7:]))
+            else:
+                action.triggered.connect(getattr(self, slot))
+            menu.addAction(action)
+            if attribute is not None:
+                setattr(self, attribute, action)
+    
+    def _build_menu(self, title, specs):
+        """Add a top-level menu filled from an action table."""
+        menu = self.menubar.addMenu(title)
+        self._add_actions(menu, specs)
+        return menu
         
     def create_view_menu(self):
         """Create the View menu with its actions."""
-        self.view_menu = self.menubar.addMenu("&View")
-        
-        # Statistics action
-        stats_action = QtGui.QAction("&Statistics...", self.parent)
-        stats_action.triggered.connect(self.parent.show_statistics)
-        self.view_menu.addAction(stats_action)
+        self.view_menu = self._build_menu("&View", self._VIEW_ACTIONS)
     
     def create_file_menu(self):
         """Create the File menu with its actions."""
-        file_menu = self.menubar.addMenu("&File")
-        
-        # Exit action
-        exit_action = QtGui.QAction("E&xit", self.parent)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.parent.close)
-        file_menu.addAction(exit_action)
+        self._build_menu("&File", self._FILE_ACTIONS)
     
     def create_edit_menu(self):
         """Create the Edit menu with its actions."""
-        edit_menu = self.menubar.addMenu("&Edit")
-        
-        # Clear log action
-        clear_action = QtGui.QAction("&Clear Log", self.parent)
-        clear_action.triggered.connect(self.parent.clear_log)
-        edit_menu.addAction(clear_action)
-        
-        # Add separator
-        edit_menu.addSeparator()
-        
-        # Toggle read/write mode
-        self.read_mode_action = QtGui.QAction("Read Mode", self.parent, checkable=True)
+        self._build_menu("&Edit", self._EDIT_ACTIONS)
         self.read_mode_action.setChecked(True)
-        self.read_mode_action.triggered.connect(self.toggle_read_write_mode)
-        edit_menu.addAction(self.read_mode_action)
     
     def create_tools_menu(self):
         """Create the Tools menu with its actions."""
-        tools_menu = self.menubar.addMenu("&Tools")
-        
-        # Tag Tools action
-        tag_tools_action = QtGui.QAction("Tag &Tools...", self.parent)
-        tag_tools_action.triggered.connect(self.show_tag_tools)
-        tools_menu.addAction(tag_tools_action)
-        
-        # Tag Database action
-        tag_db_action = QtGui.QAction("Tag &Database...", self.parent)
-        tag_db_action.triggered.connect(self.show_tag_database)
-        tools_menu.addAction(tag_db_action)
-        
-        # NFC Diagnostics action
-        diagnostics_action = QtGui.QAction("NFC &Diagnostics...", self.parent)
-        diagnostics_action.triggered.connect(self.run_diagnostics)
-        tools_menu.addAction(diagnostics_action)
-               
-        # Add separator
-        tools_menu.addSeparator()
-        
-        # Format tag action
-        format_action = QtGui.QAction("&Format Tag", self.parent)
-        format_action.triggered.connect(self.format_tag)
-        tools_menu.addAction(format_action)
-        
-        # Add separator
-        tools_menu.addSeparator()
-        
-        # Emulate tag action
-        emulate_action = QtGui.QAction("&Emulate Tag...", self.parent)
-        emulate_action.triggered.connect(self.emulate_tag)
-        tools_menu.addAction(emulate_action)
-        
-        # Add separator
-        tools_menu.addSeparator()
-        
-        # Settings action
-        settings_action = QtGui.QAction("&Settings...", self.parent)
-        settings_action.triggered.connect(self.show_settings)
-        settings_action.setShortcut("Ctrl+")
-        tools_menu.addAction(settings_action)
+        self._build_menu("&Tools", self._TOOLS_ACTIONS)
     
     def create_security_menu(self):
         """Create the Security menu with its actions."""
@@ -116,12 +159,7 @@ class AppMenu:
         
         # Session submenu
         session_menu = security_menu.addMenu("&Session")
-        
-        # Lock Session action
-        self.lock_action = QtGui.QAction("&Lock Session", self.parent)
-        self.lock_action.setShortcut("Ctrl+L")
-        self.lock_action.triggered.connect(self.parent.lock_application)
-        session_menu.addAction(self.lock_action)
+        self._add_actions(session_menu, self._SESSION_ACTIONS)
         
         # Session Timeout submenu
         timeout_menu = session_menu.addMenu("&Timeout")
@@ -130,50 +168,25 @@ class AppMenu:
         self.timeout_group = QtGui.QActionGroup(self.parent)
         self.timeout_group.setExclusive(True)
         
-        # Add timeout options
-        timeouts = [
-            ("5 minutes", 5),
-            ("15 minutes", 15),
-            ("30 minutes", 30),
-            ("1 hour", 60),
-            ("Never (not recommended)", 0)
-        ]
-        
+        from .settings_manager import settings_manager
         current_timeout = settings_manager.get('security.session_timeout', 15)
+        checked_index = next(
+            (i for i, (_, minutes) in enumerate(TIMEOUT_OPTIONS) if minutes == current_timeout), -1
+        )
         
-        for text, minutes in timeouts:
+        # Add timeout options
+        for text, minutes in TIMEOUT_OPTIONS:
             action = QtGui.QAction(text, self.parent, checkable=True)
             action.setData(minutes)
-            if minutes == current_timeout:
-                action.setChecked(True)
             action.triggered.connect(self.set_session_timeout)
             self.timeout_group.addAction(action)
             timeout_menu.addAction(action)
         
-        # Add separator
-        security_menu.addSeparator()
-        
-        # Change Password action
-        change_pw_action = QtGui.QAction("Change &Password...", self.parent)
-        change_pw_action.triggered.connect(self.change_password)
-        security_menu.addAction(change_pw_action)
-        
-        # Add separator
-        security_menu.addSeparator()
+        if checked_index >= 0:
+            self.timeout_group.actions()[checked_index].setChecked(True)
         
-        # Password Recovery action
-        recovery_action = QtGui.QAction("Password &Recovery...", self.parent)
-        recovery_action.triggered.connect(self.show_password_recovery)
-        security_menu.addAction(recovery_action)
-        
-        # Add separator
-        security_menu.addSeparator()
-        
-        # Require Password action
-        self.require_pw_action = QtGui.QAction("Require &Password", self.parent, checkable=True)
+        self._add_actions(security_menu, self._SECURITY_ACTIONS)
         self.require_pw_action.setChecked(self.auth_manager.is_password_set())
-        self.require_pw_action.triggered.connect(self.toggle_password_protection)
-        security_menu.addAction(self.require_pw_action)
     
     def set_session_timeout(self):
         """Handle session timeout change from menu."""
@@ -184,29 +197,7 @@ class AppMenu:
     
     def create_help_menu(self):
         """Create the Help menu with its actions."""
-        help_menu = self.menubar.addMenu("&Help")
-        
-        # Help action
-        help_action = QtGui.QAction("&Help", self.parent)
-        help_action.setShortcut(Qt.Key_F1)
-        help_action.triggered.connect(self.show_help)
-        help_menu.addAction(help_action)
-        
-        # Add separator
-        help_menu.addSeparator()
-        
-        # Wiki action
-        wiki_action = QtGui.QAction("&WIKI", self.parent)
-        wiki_action.triggered.connect(self.open_wiki)
-        help_menu.addAction(wiki_action)
-        
-        # Add separator
-        help_menu.addSeparator()
-        
-        # About action
-        about_action = QtGui.QAction("&About", self.parent)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self._build_menu("&Help", self._HELP_ACTIONS)
     
     @Slot()
     def open_wiki(self):
@@ -228,6 +219,7 @@ class AppMenu:
     @Slot()
     def show_help(self):
         """Show the help dialog."""
+        from .help_dialog import HelpDialog
         help_dialog = HelpDialog(self.parent)
         help_dialog.exec()
         
@@ -242,7 +234,8 @@ class AppMenu:
         """
         if not self.auth_manager.is_password_set():
             return True
-            
+        
+        from .auth import PasswordDialog
         if PasswordDialog.verify_password(self.auth_manager, self.parent):
             return True
             
@@ -255,6 +248,7 @@ class AppMenu:
     
     def change_password(self):
         """Show the change password dialog."""
+        from .auth import PasswordDialog
         if PasswordDialog.set_password(self.auth_manager, self.parent):
             self.require_pw_action.setChecked(self.auth_manager.is_password_set())
             QMessageBox.information(
@@ -287,6 +281,7 @@ class AppMenu:
     
     def toggle_password_protection(self):
         """Toggle password protection on/off."""
+        from .auth import PasswordDialog
         if self.auth_manager.is_password_set():
             # Verify current password before disabling
             if PasswordDialog.verify_password(self.auth_manager, self.parent):
@@ -311,12 +306,8 @@ class AppMenu:
             
         try:
             from .tag_tools_dialog import TagToolsDialog
-            from .nfc_operations import NfcOperations
-            from .tag_database import TagDatabase
             
-            nfc_ops = NfcOperations()
-            db = TagDatabase()
-            dialog = TagToolsDialog(nfc_ops, db, self.parent)
+            dialog = TagToolsDialog(self.nfc_ops, self.db, self.parent)
             dialog.exec()
         except Exception as e:
             QMessageBox.critical(
@@ -331,11 +322,9 @@ class AppMenu:
             return
             
         try:
-            from .tag_database import TagDatabase
             from .tag_database_dialog import TagDatabaseDialog
             
-            db = TagDatabase()
-            dialog = TagDatabaseDialog(db, self.parent)
+            dialog = TagDatabaseDialog(self.db, self.parent)
             dialog.exec()
         except Exception as e:
             QMessageBox.critical(
@@ -349,13 +338,8 @@ class AppMenu:
         if not self.require_authentication("use tag cloner"):
             return
             
-        from .nfc_operations import NfcOperations
-        from .tag_database import TagDatabase
-        
         try:
-            nfc_ops = NfcOperations()
-            db = TagDatabase()
-            dialog = TagClonerDialog(nfc_ops, db, self.parent)  # Create this dialog if needed
+            dialog = TagClonerDialog(self.nfc_ops, self.db, self.parent)  # Create this dialog if needed
             dialog.exec()
         except Exception as e:
             QMessageBox.critical(
@@ -9,13 +9,55 @@ about available readers, backends, and system dependencies.
 
 import sys
 import os
+import argparse
+import json
 import platform
+import re
+import shutil
+import threading
+import time
 import traceback
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any
 
+# Neither the platform nor the interpreter changes while the script runs
+_SYSTEM = platform.system()
+_PYTHON_VER = sys.version_info
+
+@lru_cache(maxsize=None)
+def _try_import(module_path):
+    """Import a module once per diagnostics run; returns None if it is missing."""
+    try:
+        return importlib.import_module(module_path)
+    except ImportError:
+        return None
+
+def _is_installed(module_path):
+    """Check that a module can be imported without executing it."""
+    try:
+        return importlib.util.find_spec(module_path) is not None
+    except (ImportError, ValueError):
+        # Missing parent package, or a module without a spec
+        return False
+
+def _require(module_path):
+    """Return the cached module, raising ImportError if it is not installed."""
+    module = _try_import(module_path)
+    if module is None:
+        raise ImportError(f"No module named '{module_path}'")
+    return module
+
+@lru_cache(maxsize=1)
+def _list_ports():
+    """Enumerate serial ports once per diagnostics run."""
+    return tuple(_require('serial.tools.list_ports').comports())
+
 def check_python_version():
     """Check if Python version is compatible."""
-    version = sys.version_info
+    version = _PYTHON_VER
     if version.major < 3 or (version.major == 3 and version.minor < 8):
         return False, f"Python {version.major}.{version.minor} is not supported. Please use Python 3.8 or higher."
     return True, f"Python {version.major}.{version.minor}.{version.micro} - OK"
@@ -30,258 +72,363 @@ def check_dependencies():
         'ndeflib': 'ndef',
     }
     
-    results = {}
-    for name, module_path in dependencies.items():
-        try:
-            __import__(module_path)
-            results[name] = True
-        except ImportError:
-            results[name] = False
-    
-    return results
+    # Only locate the modules; importing PySide6 alone loads the Qt libraries
+    return {name: _is_installed(module_path)
+            for name, module_path in dependencies.items()}
 
 def check_system_dependencies():
     """Check system-level dependencies."""
     issues = []
-    system = platform.system()
     
-    if system == 'Windows':
-        try:
-            import ctypes
+    if _SYSTEM == 'Windows':
+        ctypes_util = _try_import('ctypes.util')
+        if ctypes_util is None:
+            issues.append("ctypes not available")
+        else:
+            # Only resolve the DLL paths; loading them would keep both
+            # libraries mapped into this process
             # Check for libusb
-            try:
-                libusb = ctypes.CDLL('libusb-1.0.dll')
-            except:
+            if ctypes_util.find_library('libusb-1.0') is None:
                 issues.append("libusb not found - install from https://libusb.info/")
             
             # Check for PC/SC
-            try:
-                winscard = ctypes.CDLL('winscard.dll')
-            except:
+            if ctypes_util.find_library('winscard') is None:
                 issues.append("PC/SC not available - install PC/SC drivers")
-                
-        except ImportError:
-            issues.append("ctypes not available")
     
-    elif system == 'Linux':
+    elif _SYSTEM == 'Linux':
+        # Plain PATH lookups; no `which` processes are spawned
+        if shutil.which('pcscd') is None:
+            issues.append("pcscd not found - install: sudo apt install pcscd")
+        
+        if shutil.which('libusb') is None:
+            issues.append("libusb not found - install: sudo apt install libusb-1.0-0-dev")
+    
+    return issues
+
+class _Log:
+    """Collects output lines and writes them to stdout in a single call."""
+    
+    def __init__(self):
+        self.buf = []
+        self.debug_enabled = False
+    
+    def __call__(self, *args):
+        self.buf.append(' '.join(map(str, args)))
+    
+    def debug(self, message, indent="   "):
+        if self.debug_enabled:
+            self.buf.append(f"{indent}[DEBUG] {message}")
+    
+    def flush(self):
+        if self.buf:
+            # Looked up per flush, so redirected stdout (as in the GUI) works
+            sys.stdout.write('\n'.join(self.buf) + '\n')
+            self.buf.clear()
+
+_log = _Log()
+
+def _discard(line):
+    """Debug sink used by worker threads while debug output is disabled."""
+
+# nfcpy serial path prefix on this platform
+_PREFIX = 'com:' if _SYSTEM == 'Windows' else 'tty:'
+
+# Arduino-based card copier, also probed at these explicit baud rates
+_ARDUINO_READER_ID = 0x23410043
+_ARDUINO_BAUDS = (115200, 9600, 19200, 38400, 57600)
+
+# Known USB devices, keyed by (vid << 16) | pid
+_KNOWN_CHIPS = {
+    # Dedicated NFC/RFID readers that might use Arduino-compatible chips
+    0x23410043: "Smart Access Control Card Copier (13.56MHz/125KHz/250KHz) - NFC/RFID Reader",
+    0x23410010: "NFC/RFID Access Control System",
+    0x2A030043: "Encrypted Card Decoder/Access Control System",
+    
+    # NS106 Dual Frequency RFID/NFC Reader
+    0x072F2200: "NS106 Dual Frequency RFID/NFC Reader (125KHz/13.56MHz)",
+    
+    # Common NFC readers
+    0x072F90CC: "ACR1222L NFC Reader",
+    0x04CC0531: "PN532 NFC Module",
+    0x054C06C1: "Sony RC-S380 NFC Reader",
+    0x1D6B0001: "Linux Foundation NFC Reader",
+    0x165C0011: "PN532 NFC controller",
+    
+    # USB-to-Serial chips (for reference)
+    0x1A867523: "CH340 USB-to-Serial",
+    0x04036001: "FTDI FT232RL",
+    0x10C4EA60: "Silicon Labs CP2102",
+    0x067B2303: "Prolific PL2303",
+    
+    # Arduino boards (for reference - less likely to be NFC readers)
+    0x23410042: "Arduino Uno",
+    0x23410010: "Arduino Mega",
+}
+
+# Chips in _KNOWN_CHIPS that are (or may be) NFC/RFID readers
+_NFC_CHIP_IDS = frozenset({
+    0x23410043, 0x23410010, 0x2A030043, 0x072F2200,
+    0x072F90CC, 0x04CC0531, 0x054C06C1, 0x165C0011,
+})
+
+# Extra device details per chip, in the order they are reported
+_KNOWN_CHIP_META = {
+    0x23410043: {
+        'note': "This is a dedicated Smart Access Control Card Copier device that supports multiple frequencies (13.56MHz/125KHz/250KHz).",
+        'recommendation': "This device should work as an NFC reader. Try installing libusb and running as administrator.",
+        'expected_behavior': "Should be recognized as a dedicated NFC/RFID reader, not an Arduino.",
+    },
+    0x23410010: {
+        'note': "This device appears to be an NFC/RFID Access Control System.",
+        'recommendation': "Try connecting with default baud rates.",
+    },
+    0x2A030043: {
+        'note': "This device appears to be an Encrypted Card Decoder/Access Control System.",
+        'recommendation': "Try connecting with default baud rates.",
+    },
+    0x072F2200: {
+        'note': "This is a NS106 Dual Frequency RFID/NFC Reader that supports both 125KHz and 13.56MHz frequencies.",
+        'recommendation': "This device is CCID and PC/SC compliant. It should work with standard NFC libraries without additional drivers.",
+        'expected_behavior': "Should be recognized as a standard CCID/PCSC device. Try USB or PCSC backend.",
+        'supported_cards': "Supports EM4100, TK4100, T5577 (125KHz) and various 13.56MHz IC cards including UID, FUID, CUID, UFUID cards.",
+    },
+    0x072F90CC: {
+        'note': "This is an ACS ACR1222L NFC Reader.",
+        'recommendation': "This device should work with standard NFC libraries. Try USB or PCSC backend.",
+    },
+}
+
+# Common NFC reader patterns in (lowercased) port descriptions
+_NFC_PATTERNS = (
+    'nfc', 'rfid', 'smart card', 'acr', 'pn532', 'rc-s380',
+    'reader', 'contactless', 'proximity', 'identification',
+    'dispositivo seriale', 'serial usb', 'usb serial', 'ch340',
+    'ftdi', 'cp2102', 'pl2303', 'rc522', 'mfrc522',
+    'ns106', 'kadongli', 'dual frequency', '125khz', '13.56mhz',
+    'ic/id', 'card copier', 'duplicator', 'programmer'
+)
+
+# All patterns in one alternation, so each description is scanned once
+_NFC_PAT_RE = re.compile('|'.join(map(re.escape, _NFC_PATTERNS)))
+
+# Identifications that mark a serial device as a dedicated NFC/RFID reader
+_NFC_KEYWORDS = ('nfc', 'rfid', 'access control', 'card copier', 'smart access')
+
+# nfcpy backends probed by test_nfc_backends
+_BACKENDS = ('usb', 'pcsc', 'uart')
+
+# Seconds to wait for a single ContactlessFrontend open. Much shorter
+# values can report readers on slow USB stacks as unavailable.
+PROBE_TIMEOUT = 3.0
+
+# Probe threads that timed out and may still hold their device open,
+# as (path, thread) pairs; see _wait_for_stray_probes
+_STRAY_PROBES = []
+
+def _open_frontend(nfc, path, timeout=PROBE_TIMEOUT):
+    """Open and close an nfcpy frontend, giving up after `timeout` seconds.
+    
+    A hanging open is left behind on a daemon thread (it closes the frontend
+    should it still succeed), so a misbehaving reader cannot stall the run.
+    Such threads are recorded in _STRAY_PROBES.
+    
+    Raises:
+        TimeoutError: If the frontend did not open in time
+        Exception: Whatever ContactlessFrontend raised
+    """
+    outcome = {}
+    
+    def attempt():
         try:
-            import subprocess
-            result = subprocess.run(['which', 'pcscd'], capture_output=True, text=True)
-            if result.returncode != 0:
-                issues.append("pcscd not found - install: sudo apt install pcscd")
-            
-            result = subprocess.run(['which', 'libusb'], capture_output=True, text=True)
-            if result.returncode != 0:
-                issues.append("libusb not found - install: sudo apt install libusb-1.0-0-dev")
-                
+            nfc.ContactlessFrontend(path).close()
         except Exception as e:
-            issues.append(f"Error checking Linux dependencies: {str(e)}")
+            outcome['error'] = e
     
-    return issues
+    thread = threading.Thread(target=attempt, name=f"nfc-probe {path}", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        _STRAY_PROBES.append((path, thread))
+        raise TimeoutError(f"No response from {path} within {timeout:g} seconds")
+    if 'error' in outcome:
+        raise outcome['error']
+
+def _wait_for_stray_probes(timeout=PROBE_TIMEOUT):
+    """Give timed-out probe threads up to `timeout` seconds in total to finish.
+    
+    Returns:
+        list: Paths of the probes still running, whose devices may be busy
+    """
+    deadline = time.monotonic() + timeout
+    for _, thread in _STRAY_PROBES:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    _STRAY_PROBES[:] = [(path, thread) for path, thread in _STRAY_PROBES if thread.is_alive()]
+    return [path for path, _ in _STRAY_PROBES]
 
 def test_nfc_backends():
     """Test available NFC backends."""
     backends = []
     errors = {}
     
-    try:
-        import nfc
-        
-        # Test USB backend
-        try:
-            clf = nfc.ContactlessFrontend('usb')
-            backends.append('usb')
-            clf.close()
-        except Exception as e:
-            errors['usb'] = str(e)
-        
-        # Test PC/SC backend
-        try:
-            clf = nfc.ContactlessFrontend('pcsc')
-            backends.append('pcsc')
-            clf.close()
-        except Exception as e:
-            errors['pcsc'] = str(e)
+    nfc = _try_import('nfc')
+    if nfc is None:
+        errors['nfcpy'] = "nfcpy not installed"
+    else:
+        # The backends are independent, so a slow one no longer delays the
+        # others; results are collected in _BACKENDS order
+        with ThreadPoolExecutor(max_workers=len(_BACKENDS)) as executor:
+            futures = [(name, executor.submit(_open_frontend, nfc, name))
+                       for name in _BACKENDS]
+            for name, future in futures:
+                try:
+                    future.result()
+                    backends.append(name)
+                except Exception as e:
+                    errors[name] = str(e)
+    
+    return backends, errors
+
+def _iter_connection_formats(port, chip_id):
+    """Yield nfcpy connection strings for a serial port, default first.
+    
+    Arduino-based readers additionally get explicit baud rates, which are only
+    reached when the default format failed without a fatal error.
+    """
+    yield f"{_PREFIX}{port.device}"
+    if chip_id == _ARDUINO_READER_ID:
+        for baud in _ARDUINO_BAUDS:
+            yield f"{_PREFIX}{port.device}:{baud}"
+
+def _probe_port(nfc, port):
+    """Try to open an nfcpy frontend on one serial port.
+    
+    Runs on a worker thread, so debug messages are collected and returned
+    for the caller to log.
+    
+    Returns:
+        tuple: (port_result, debug_lines)
+    """
+    debug_lines = []
+    debug = debug_lines.append if _log.debug_enabled else _discard
+    
+    debug(f"Processing port: {port.device}")
+    port_result = {
+        'port': port.device,
+        'description': port.description,
+        'success': False,
+        'error': None,
+        'backend_used': None,
+        'device_details': {}
+    }
+    
+    # Collect detailed device information
+    if port.vid and port.pid:
+        vid_pid = f"VID: 0x{port.vid:04x}, PID: 0x{port.pid:04x}"
+        port_result['device_details']['vid_pid'] = vid_pid
+        debug(f"Device {vid_pid}")
+    if port.manufacturer:
+        port_result['device_details']['manufacturer'] = port.manufacturer
+        debug(f"Device manufacturer: {port.manufacturer}")
+    if port.product:
+        port_result['device_details']['product'] = port.product
+        debug(f"Device product: {port.product}")
+    if port.serial_number:
+        port_result['device_details']['serial_number'] = port.serial_number
+        debug(f"Device serial: {port.serial_number}")
+    
+    # Try to identify the device type
+    chip_id = (port.vid << 16) | port.pid if port.vid and port.pid else -1
+    identified_as = _KNOWN_CHIPS.get(chip_id)
+    if identified_as is not None:
+        port_result['device_details']['identified_as'] = identified_as
+        debug(f"Device identified as: {identified_as}")
         
-        # Test UART backend
+        # Special handling for different types of devices
+        port_result['device_details'].update(_KNOWN_CHIP_META.get(chip_id, ()))
+    else:
+        debug(f"Device not in known chips database")
+    
+    # Opening a frontend can block for seconds, so only probe ports that look
+    # like NFC readers
+    combined_text = f"{port.description} {port.product} {port.manufacturer}".lower()
+    if chip_id not in _NFC_CHIP_IDS and not _NFC_PAT_RE.search(combined_text):
+        port_result['skipped'] = True
+        debug(f"Not an NFC reader candidate - skipping connection attempts")
+        return port_result, debug_lines
+    
+    if chip_id == _ARDUINO_READER_ID:
+        debug("Arduino-based device detected - baud rates will be tried if the default fails")
+    
+    # Try each connection format; later formats are only built if needed
+    for conn_format in _iter_connection_formats(port, chip_id):
         try:
-            clf = nfc.ContactlessFrontend('uart')
-            backends.append('uart')
-            clf.close()
+            debug(f"Trying format: {conn_format}")
+            _open_frontend(nfc, conn_format)
+            port_result['success'] = True
+            port_result['backend_used'] = conn_format
+            debug(f"Successfully connected using: {conn_format}")
+            break
+        except TimeoutError as e:
+            # Other formats would only wait on the same unresponsive device
+            port_result['error'] = str(e)
+            debug(f"Timed out with format {conn_format}")
+            break
         except Exception as e:
-            errors['uart'] = str(e)
-            
-    except ImportError:
-        errors['nfcpy'] = "nfcpy not installed"
+            port_result['error'] = str(e)
+            debug(f"Failed with format {conn_format}: {str(e)}")
+            # Don't continue if we get a "no such device" error - it means the format is wrong
+            if "No such device" in str(e) or "No backend available" in str(e):
+                break
+            continue
     
-    return backends, errors
+    return port_result, debug_lines
 
-def test_serial_ports():
-    """Test direct connection to detected serial ports."""
-    results = []
+def iter_serial_ports():
+    """Test direct connection to detected serial ports.
     
+    Yields each port's result as soon as it is known, in port order, so
+    callers can report progress while slower ports are still being probed.
+    """
+    count = 0
     try:
-        import nfc
-        import serial.tools.list_ports
+        nfc = _require('nfc')
         
         # Get all serial ports
-        ports = serial.tools.list_ports.comports()
-        print(f"   [DEBUG] Found {len(ports)} serial ports")
+        ports = _list_ports()
+        _log.debug(f"Found {len(ports)} serial ports")
         
         if not ports:
-            results.append({'error': 'No serial ports found'})
-            return results
+            count += 1
+            yield {'error': 'No serial ports found'}
+            return
         
-        for port in ports:
-            print(f"   [DEBUG] Processing port: {port.device}")
-            port_result = {
-                'port': port.device,
-                'description': port.description,
-                'success': False,
-                'error': None,
-                'backend_used': None,
-                'device_details': {}
-            }
-            
-            # Collect detailed device information
-            if port.vid and port.pid:
-                port_result['device_details']['vid_pid'] = f"VID: 0x{port.vid:04x}, PID: 0x{port.pid:04x}"
-                print(f"   [DEBUG] Device VID/PID: 0x{port.vid:04x}, 0x{port.pid:04x}")
-            if port.manufacturer:
-                port_result['device_details']['manufacturer'] = port.manufacturer
-                print(f"   [DEBUG] Device manufacturer: {port.manufacturer}")
-            if port.product:
-                port_result['device_details']['product'] = port.product
-                print(f"   [DEBUG] Device product: {port.product}")
-            if port.serial_number:
-                port_result['device_details']['serial_number'] = port.serial_number
-                print(f"   [DEBUG] Device serial: {port.serial_number}")
-            
-            # Try to identify the device type
-            known_chips = {
-                # Dedicated NFC/RFID readers that might use Arduino-compatible chips
-                (0x2341, 0x0043): "Smart Access Control Card Copier (13.56MHz/125KHz/250KHz) - NFC/RFID Reader",
-                (0x2341, 0x0010): "NFC/RFID Access Control System",
-                (0x2A03, 0x0043): "Encrypted Card Decoder/Access Control System",
-                
-                # NS106 Dual Frequency RFID/NFC Reader
-                (0x072F, 0x2200): "NS106 Dual Frequency RFID/NFC Reader (125KHz/13.56MHz)",
-                
-                # Common NFC readers
-                (0x072F, 0x90CC): "ACR1222L NFC Reader",
-                (0x04CC, 0x0531): "PN532 NFC Module",
-                (0x054C, 0x06C1): "Sony RC-S380 NFC Reader",
-                (0x1D6B, 0x0001): "Linux Foundation NFC Reader",
-                (0x165c, 0x0011): "PN532 NFC controller",
-                
-                # USB-to-Serial chips (for reference)
-                (0x1a86, 0x7523): "CH340 USB-to-Serial",
-                (0x0403, 0x6001): "FTDI FT232RL",
-                (0x10c4, 0xea60): "Silicon Labs CP2102",
-                (0x067b, 0x2303): "Prolific PL2303",
-                
-                # Arduino boards (for reference - less likely to be NFC readers)
-                (0x2341, 0x0042): "Arduino Uno",
-                (0x2341, 0x0010): "Arduino Mega",
-            }
-                
-            chip_id = (port.vid, port.pid)
-            if chip_id in known_chips:
-                port_result['device_details']['identified_as'] = known_chips[chip_id]
-                print(f"   [DEBUG] Device identified as: {known_chips[chip_id]}")
-                
-                # Special handling for different types of devices
-                if chip_id == (0x2341, 0x0043):
-                    port_result['device_details']['note'] = "This is a dedicated Smart Access Control Card Copier device that supports multiple frequencies (13.56MHz/125KHz/250KHz)."
-                    port_result['device_details']['recommendation'] = "This device should work as an NFC reader. Try installing libusb and running as administrator."
-                    port_result['device_details']['expected_behavior'] = "Should be recognized as a dedicated NFC/RFID reader, not an Arduino."
-                elif chip_id == (0x2341, 0x0010):
-                    port_result['device_details']['note'] = "This device appears to be an NFC/RFID Access Control System."
-                    port_result['device_details']['recommendation'] = "Try connecting with default baud rates."
-                elif chip_id == (0x2A03, 0x0043):
-                    port_result['device_details']['note'] = "This device appears to be an Encrypted Card Decoder/Access Control System."
-                    port_result['device_details']['recommendation'] = "Try connecting with default baud rates."
-                elif chip_id == (0x072F, 0x2200):
-                    port_result['device_details']['note'] = "This is a NS106 Dual Frequency RFID/NFC Reader that supports both 125KHz and 13.56MHz frequencies."
-                    port_result['device_details']['recommendation'] = "This device is CCID and PC/SC compliant. It should work with standard NFC libraries without additional drivers."
-                    port_result['device_details']['expected_behavior'] = "Should be recognized as a standard CCID/PCSC device. Try USB or PCSC backend."
-                    port_result['device_details']['supported_cards'] = "Supports EM4100, TK4100, T5577 (125KHz) and various 13.56MHz IC cards including UID, FUID, CUID, UFUID cards."
-                elif chip_id == (0x072F, 0x90CC):
-                    port_result['device_details']['note'] = "This is an ACS ACR1222L NFC Reader."
-                    port_result['device_details']['recommendation'] = "This device should work with standard NFC libraries. Try USB or PCSC backend."
-            else:
-                print(f"   [DEBUG] Device not in known chips database")
-            
-            # Try different connection formats
-            connection_formats = []
-            
-            if platform.system() == 'Windows':
-                connection_formats = [
-                    f"com:{port.device}",
-                    f"com:{port.device.replace('COM', '')}",
-                    port.device
-                ]
-                
-                # Special handling for Arduino-based NFC readers
-                if port.vid == 0x2341 and port.pid == 0x0043:
-                    print(f"   [DEBUG] Arduino-based device detected - trying additional connection methods")
-                    # Try different baud rates for Arduino serial communication
-                    connection_formats.extend([
-                        f"com:{port.device}:115200",
-                        f"com:{port.device}:9600",
-                        f"com:{port.device}:19200",
-                        f"com:{port.device}:38400",
-                        f"com:{port.device}:57600",
-                    ])
-            else:
-                connection_formats = [
-                    f"tty:{port.device}",
-                    port.device
-                ]
-                
-                # Special handling for Arduino-based NFC readers on Linux/Mac
-                if port.vid == 0x2341 and port.pid == 0x0043:
-                    print(f"   [DEBUG] Arduino-based device detected - trying additional connection methods")
-                    connection_formats.extend([
-                        f"tty:{port.device}:115200",
-                        f"tty:{port.device}:9600",
-                        f"tty:{port.device}:19200",
-                        f"tty:{port.device}:38400",
-                        f"tty:{port.device}:57600",
-                    ])
-            
-            print(f"   [DEBUG] Trying connection formats: {connection_formats}")
-            
-            # Try each connection format
-            for conn_format in connection_formats:
-                try:
-                    print(f"   [DEBUG] Trying format: {conn_format}")
-                    clf = nfc.ContactlessFrontend(conn_format)
-                    if clf:
-                        port_result['success'] = True
-                        port_result['backend_used'] = conn_format
-                        clf.close()
-                        print(f"   [DEBUG] Successfully connected using: {conn_format}")
-                        break
-                except Exception as e:
-                    port_result['error'] = str(e)
-                    print(f"   [DEBUG] Failed with format {conn_format}: {str(e)}")
-                    # Don't continue if we get a "no such device" error - it means the format is wrong
-                    if "No such device" in str(e) or "No backend available" in str(e):
-                        break
-                    continue
-            
-            results.append(port_result)
-            print(f"   [DEBUG] Added port result with {len(port_result['device_details'])} device details")
+        # Ports are probed concurrently; the formats for one port are still
+        # tried in order since they all open the same device
+        with ThreadPoolExecutor(max_workers=min(8, len(ports))) as executor:
+            futures = [executor.submit(_probe_port, nfc, port) for port in ports]
+            for future in futures:
+                port_result, debug_lines = future.result()
+                for line in debug_lines:
+                    _log.debug(line)
+                _log.debug(f"Added port result with {len(port_result['device_details'])} device details")
+                count += 1
+                yield port_result
             
     except ImportError as e:
-        results.append({'error': f'Missing dependency: {str(e)}'})
-        print(f"   [DEBUG] ImportError: {str(e)}")
+        _log.debug(f"ImportError: {str(e)}")
+        count += 1
+        yield {'error': f'Missing dependency: {str(e)}'}
     except Exception as e:
-        results.append({'error': f'Error testing serial ports: {str(e)}'})
-        print(f"   [DEBUG] Exception: {str(e)}")
+        _log.debug(f"Exception: {str(e)}")
+        count += 1
+        yield {'error': f'Error testing serial ports: {str(e)}'}
     
-    print(f"   [DEBUG] Returning {len(results)} results")
+    _log.debug(f"Returned {count} results")
+
+def test_serial_ports():
+    """Test direct connection to detected serial ports."""
+    results = list(iter_serial_ports())
+    _log.flush()
     return results
 
 def detect_serial_devices():
@@ -289,20 +436,8 @@ def detect_serial_devices():
     devices = []
     
     try:
-        import serial.tools.list_ports
-        
         # Get all serial ports
-        ports = serial.tools.list_ports.comports()
-        
-        # Common NFC reader patterns in descriptions
-        nfc_patterns = [
-            'nfc', 'rfid', 'smart card', 'acr', 'pn532', 'rc-s380',
-            'reader', 'contactless', 'proximity', 'identification',
-            'dispositivo seriale', 'serial usb', 'usb serial', 'ch340',
-            'ftdi', 'cp2102', 'pl2303', 'pn532', 'rc522', 'mfrc522',
-            'ns106', 'kadongli', 'dual frequency', '125khz', '13.56mhz',
-            'ic/id', 'card copier', 'duplicator', 'programmer'
-        ]
+        ports = _list_ports()
         
         for port in ports:
             device_info = {
@@ -318,7 +453,7 @@ def detect_serial_devices():
             
             # Check if it matches known NFC reader patterns
             combined_text = f"{port.description} {port.product} {port.manufacturer}".lower()
-            if any(pattern in combined_text for pattern in nfc_patterns):
+            if _NFC_PAT_RE.search(combined_text):
                 device_info['type'] = 'known_nfc'
                 devices.append(device_info)
             else:
@@ -333,188 +468,299 @@ def detect_serial_devices():
     
     return devices
 
+def _log_serial_result(log, result):
+    """Add the report lines for one serial port result."""
+    if 'error' in result and 'device_details' not in result:
+        log(f"   ❌ {result['error']}")
+        return
+    
+    if result.get('success', False):
+        status_icon = "✅"
+    elif result.get('skipped', False):
+        status_icon = "➖"
+    else:
+        status_icon = "❌"
+    log(f"   {status_icon} {result['port']} ({result['description']})")
+    
+    # Always show device details if available
+    if result.get('device_details'):
+        log("      Device Details:")
+        for key, value in result['device_details'].items():
+            log(f"         {key}: {value}")
+    
+    if result.get('success', False):
+        log(f"      Backend used: {result['backend_used']}")
+    elif result.get('skipped', False):
+        log("      Skipped: does not look like an NFC reader")
+    else:
+        log(f"      Error: {result.get('error', 'Unknown error')}")
+    
+    if not result.get('device_details'):
+        log.debug("No device details found", indent="      ")
+
 def run_diagnostics():
-    """Run comprehensive NFC diagnostics."""
-    print("🔍 NFC Diagnostics Tool (ENHANCED VERSION)")
-    print("=" * 50)
+    """Run comprehensive NFC diagnostics.
+    
+    Set the NFC_DIAG_DEBUG environment variable to include [DEBUG] lines.
+    """
+    # Re-enumerate on every run (the GUI's Refresh calls this again), but
+    # only once within a run
+    _list_ports.cache_clear()
+    _try_import.cache_clear()
+    
+    _log.debug_enabled = bool(os.environ.get('NFC_DIAG_DEBUG'))
+    try:
+        _run_checks(_log)
+    finally:
+        _log.flush()
+
+def _run_checks(log):
+    """Run the diagnostic sections, writing out each one when it completes."""
+    log("🔍 NFC Diagnostics Tool (ENHANCED VERSION)")
+    log("=" * 50)
     
     # Check Python version
-    print("\n1. Python Version Check:")
+    log("\n1. Python Version Check:")
     python_ok, python_msg = check_python_version()
     status = "✅" if python_ok else "❌"
-    print(f"   {status} {python_msg}")
+    log(f"   {status} {python_msg}")
+    
+    if not python_ok:
+        # None of the other checks can work on an unsupported interpreter
+        log("\n" + "=" * 50)
+        log("📋 Summary and Recommendations:")
+        log("❌ Please upgrade Python to 3.8 or higher")
+        return
     
     # Check dependencies
-    print("\n2. Python Dependencies:")
+    log.flush()
+    
+    log("\n2. Python Dependencies:")
     deps = check_dependencies()
     for dep, installed in deps.items():
         status = "✅" if installed else "❌"
-        print(f"   {status} {dep}: {'Installed' if installed else 'Missing'}")
+        log(f"   {status} {dep}: {'Installed' if installed else 'Missing'}")
+    
+    if not deps['nfcpy'] and not deps['pyserial']:
+        # Every reader test below needs at least one of them
+        log("\n❌ Neither nfcpy nor pyserial is installed - skipping the reader tests")
+        log("   Install them first: pip install nfcpy pyserial")
+        return
+    
+    # The system check, backend probe and device detection are independent
+    # and mostly wait on I/O, so they run in the background while earlier
+    # sections are reported. Backend opens that time out keep running; the
+    # serial port probe waits for them below before opening any port.
+    executor = ThreadPoolExecutor(max_workers=3)
+    sys_future = executor.submit(check_system_dependencies)
+    backends_future = executor.submit(test_nfc_backends) if deps['nfcpy'] else None
+    devices_future = executor.submit(detect_serial_devices) if deps['pyserial'] else None
+    executor.shutdown(wait=False)
     
     # Check system dependencies
-    print("\n3. System Dependencies:")
-    sys_issues = check_system_dependencies()
+    log.flush()
+    
+    log("\n3. System Dependencies:")
+    sys_issues = sys_future.result()
     if sys_issues:
         for issue in sys_issues:
-            print(f"   ❌ {issue}")
+            log(f"   ❌ {issue}")
     else:
-        print("   ✅ All system dependencies OK")
+        log("   ✅ All system dependencies OK")
     
     # Test NFC backends
-    print("\n4. NFC Backend Test:")
-    backends, errors = test_nfc_backends()
-    if backends:
-        for backend in backends:
-            print(f"   ✅ {backend} backend available")
+    log.flush()
+    
+    log("\n4. NFC Backend Test:")
+    backends, errors = [], {}
+    if not deps['nfcpy']:
+        log("   ❌ Skipped - nfcpy not installed")
     else:
-        print("   ❌ No NFC backends available")
+        backends, errors = backends_future.result()
+        if backends:
+            for backend in backends:
+                log(f"   ✅ {backend} backend available")
+        else:
+            log("   ❌ No NFC backends available")
     
-    if errors:
-        print("\n   Backend Errors:")
-        for backend, error in errors.items():
-            print(f"      {backend}: {error}")
+        if errors:
+            log("\n   Backend Errors:")
+            for backend, error in errors.items():
+                log(f"      {backend}: {error}")
     
     # Test serial ports
-    print("\n5. Serial Port Test:")
-    print("   [DEBUG] Testing serial ports with enhanced detection...")
-    serial_results = test_serial_ports()
-    print(f"   [DEBUG] Found {len(serial_results)} serial port results")
-    
-    for result in serial_results:
-        if 'error' in result and 'device_details' not in result:
-            print(f"   ❌ {result['error']}")
-        else:
-            status_icon = "✅" if result.get('success', False) else "❌"
-            print(f"   {status_icon} {result['port']} ({result['description']})")
-            
-            # Always show device details if available
-            if result.get('device_details'):
-                print("      Device Details:")
-                for key, value in result['device_details'].items():
-                    print(f"         {key}: {value}")
-            
-            if result.get('success', False):
-                print(f"      Backend used: {result['backend_used']}")
-            else:
-                print(f"      Error: {result.get('error', 'Unknown error')}")
-            
-            if not result.get('device_details'):
-                print("      [DEBUG] No device details found")
+    log.flush()
+    
+    log("\n5. Serial Port Test:")
+    serial_results = []
+    if not deps['nfcpy']:
+        log("   ❌ Skipped - nfcpy not installed")
+    else:
+        # Backend (or earlier run) probes that timed out may still hold a
+        # device; let them finish first so ports don't show up as busy
+        if backends_future is not None:
+            backends_future.result()
+        stray = _wait_for_stray_probes()
+        if stray:
+            log(f"   ⚠️ {len(stray)} earlier probe(s) still not responding: {', '.join(stray)}")
+            log("      Results for these devices may show them as busy")
+        
+        log.debug("Testing serial ports with enhanced detection...")
+        log.flush()
+        
+        # Each port is reported as soon as its probe finishes
+        for result in iter_serial_ports():
+            _log_serial_result(log, result)
+            log.flush()
+            serial_results.append(result)
+        log.debug(f"Found {len(serial_results)} serial port results")
     
     # Detect serial devices
-    print("\n6. Serial Device Detection:")
-    devices = detect_serial_devices()
-    if devices:
-        for device in devices:
-            if 'error' in device:
-                print(f"   ❌ {device['error']}")
-            else:
-                status_icon = "🎯" if device['type'] == 'known_nfc' else "❓"
-                print(f"   {status_icon} {device['description']} (Port: {device['port']})")
+    log.flush()
+    
+    log("\n6. Serial Device Detection:")
+    devices = []
+    if not deps['pyserial']:
+        log("   ❌ Skipped - pyserial not installed")
     else:
-        print("   ❌ No serial devices detected")
+        devices = devices_future.result()
+        if devices:
+            for device in devices:
+                if 'error' in device:
+                    log(f"   ❌ {device['error']}")
+                else:
+                    status_icon = "🎯" if device['type'] == 'known_nfc' else "❓"
+                    log(f"   {status_icon} {device['description']} (Port: {device['port']})")
+        else:
+            log("   ❌ No serial devices detected")
     
     # Summary and recommendations
-    print("\n" + "=" * 50)
-    print("📋 Summary and Recommendations:")
+    log.flush()
     
-    if not python_ok:
-        print("❌ Please upgrade Python to 3.8 or higher")
+    log("\n" + "=" * 50)
+    log("📋 Summary and Recommendations:")
     
     missing_deps = [dep for dep, installed in deps.items() if not installed]
     if missing_deps:
-        print(f"❌ Install missing dependencies: pip install {' '.join(missing_deps)}")
+        log(f"❌ Install missing dependencies: pip install {' '.join(missing_deps)}")
     
     if sys_issues:
-        print("❌ Resolve system dependency issues listed above")
+        log("❌ Resolve system dependency issues listed above")
     
     if not backends:
-        print("❌ No NFC backends available. Check:")
-        print("   • NFC reader is connected")
-        print("   • Drivers are installed")
-        print("   • Run as administrator (Windows)")
-        print("   • Check device permissions (Linux)")
+        log("❌ No NFC backends available. Check:")
+        log("   • NFC reader is connected")
+        log("   • Drivers are installed")
+        log("   • Run as administrator (Windows)")
+        log("   • Check device permissions (Linux)")
     
-    # Check if we found any devices that might need special handling
-    nfc_devices = [r for r in serial_results if 'device_details' in r and 
-                   any(keyword in r['device_details'].get('identified_as', '').lower() 
-                       for keyword in ['nfc', 'rfid', 'access control', 'card copier', 'smart access'])]
+    # Sort the serial port results into the buckets reported below in one pass
+    nfc_devices, arduino_devices, successful_serial_connections, skipped_ports = [], [], [], []
+    had_error = False
+    for r in serial_results:
+        if 'device_details' in r:
+            identified_as = r['device_details'].get('identified_as', '').lower()
+            # Devices that might need special handling
+            if any(keyword in identified_as for keyword in _NFC_KEYWORDS):
+                nfc_devices.append(r)
+            # Arduino devices (separate from NFC devices)
+            if 'arduino' in identified_as:
+                arduino_devices.append(r)
+        if 'error' in r:
+            had_error = True
+        elif r.get('success', False):
+            successful_serial_connections.append(r)
+        if r.get('skipped', False):
+            skipped_ports.append(r)
     
     if nfc_devices and not backends:
-        print("\n🔧 NFC/RFID Device Detected - Special Instructions:")
-        print("   A dedicated NFC/RFID device was found but is not working as expected.")
-        print("   This could mean:")
-        print("   • Missing system dependencies (libusb)")
-        print("   • Driver issues or incorrect drivers installed")
-        print("   • Permission issues (try running as administrator)")
-        print("   • The device needs specific connection parameters")
-        print("   • The device may require special software or drivers")
+        log("\n🔧 NFC/RFID Device Detected - Special Instructions:")
+        log("   A dedicated NFC/RFID device was found but is not working as expected.")
+        log("   This could mean:")
+        log("   • Missing system dependencies (libusb)")
+        log("   • Driver issues or incorrect drivers installed")
+        log("   • Permission issues (try running as administrator)")
+        log("   • The device needs specific connection parameters")
+        log("   • The device may require special software or drivers")
         
         # Show the specific device details
         for device in nfc_devices:
-            print(f"   Device: {device['port']} ({device['description']})")
+            log(f"   Device: {device['port']} ({device['description']})")
             if 'device_details' in device:
                 details = device['device_details']
                 if 'identified_as' in details:
-                    print(f"   Identified as: {details['identified_as']}")
+                    log(f"   Identified as: {details['identified_as']}")
                 if 'note' in details:
-                    print(f"   Note: {details['note']}")
+                    log(f"   Note: {details['note']}")
                 if 'recommendation' in details:
-                    print(f"   Recommendation: {details['recommendation']}")
+                    log(f"   Recommendation: {details['recommendation']}")
                 if 'expected_behavior' in details:
-                    print(f"   Expected: {details['expected_behavior']}")
-    
-    # Check for Arduino devices (separate from NFC devices)
-    arduino_devices = [r for r in serial_results if 'device_details' in r and 
-                      'arduino' in r['device_details'].get('identified_as', '').lower()]
+                    log(f"   Expected: {details['expected_behavior']}")
     
     if arduino_devices and not backends:
-        print("\n🔧 Arduino Device Detected - Special Instructions:")
-        print("   An Arduino-based device was found but is not working as an NFC reader.")
-        print("   This could mean:")
-        print("   • The device is a standard Arduino, not an NFC reader")
-        print("   • The device needs special NFC firmware")
-        print("   • The device requires a specific baud rate or connection method")
-        print("   • Try using Arduino IDE to check if NFC firmware is installed")
-        print("   • Some NFC readers use Arduino-compatible chips")
+        log("\n🔧 Arduino Device Detected - Special Instructions:")
+        log("   An Arduino-based device was found but is not working as an NFC reader.")
+        log("   This could mean:")
+        log("   • The device is a standard Arduino, not an NFC reader")
+        log("   • The device needs special NFC firmware")
+        log("   • The device requires a specific baud rate or connection method")
+        log("   • Try using Arduino IDE to check if NFC firmware is installed")
+        log("   • Some NFC readers use Arduino-compatible chips")
         
         # Show the specific Arduino device details
         for device in arduino_devices:
-            print(f"   Device: {device['port']} ({device['description']})")
+            log(f"   Device: {device['port']} ({device['description']})")
             if 'device_details' in device:
                 details = device['device_details']
                 if 'identified_as' in details:
-                    print(f"   Identified as: {details['identified_as']}")
+                    log(f"   Identified as: {details['identified_as']}")
                 if 'recommendation' in details:
-                    print(f"   Recommendation: {details['recommendation']}")
+                    log(f"   Recommendation: {details['recommendation']}")
     
     # Check serial port test results
-    successful_serial_connections = [r for r in serial_results if 'error' not in r and r.get('success', False)]
     if successful_serial_connections:
-        print("✅ Direct serial port connection successful!")
-        print(f"   Working port: {successful_serial_connections[0]['port']}")
-        print(f"   Backend: {successful_serial_connections[0]['backend_used']}")
-        print("   The main application should work with this reader.")
-    elif serial_results and not any('error' in r for r in serial_results):
-        print("❌ Serial port connections failed. This suggests:")
-        print("   • The device may not be an NFC reader")
-        print("   • The reader may require specific drivers")
-        print("   • The reader may use a proprietary protocol")
-        print("   • Try running as administrator (Windows)")
-    
-    if not devices:
-        print("❌ No serial devices detected. Check:")
-        print("   • Reader is properly connected")
-        print("   • USB cable is working")
-        print("   • Try a different USB port")
+        log("✅ Direct serial port connection successful!")
+        log(f"   Working port: {successful_serial_connections[0]['port']}")
+        log(f"   Backend: {successful_serial_connections[0]['backend_used']}")
+        log("   The main application should work with this reader.")
+    elif serial_results and not had_error:
+        log("❌ Serial port connections failed. This suggests:")
+        log("   • The device may not be an NFC reader")
+        log("   • The reader may require specific drivers")
+        log("   • The reader may use a proprietary protocol")
+        log("   • Try running as administrator (Windows)")
+    
+    if skipped_ports:
+        log(f"ℹ️ Skipped {len(skipped_ports)} serial port(s) that do not look like NFC readers")
+    
+    if not devices and deps['pyserial']:
+        log("❌ No serial devices detected. Check:")
+        log("   • Reader is properly connected")
+        log("   • USB cable is working")
+        log("   • Try a different USB port")
     
     if backends and devices:
-        print("✅ NFC setup appears to be working!")
-        print("   Try running the main application: python main.py")
+        log("✅ NFC setup appears to be working!")
+        log("   Try running the main application: python main.py")
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Diagnose NFC reader setup issues.")
+    parser.add_argument('--json', action='store_true',
+                        help="write one JSON object per serial port probe (NDJSON) "
+                             "instead of the full report")
+    args = parser.parse_args(argv)
+    
+    if args.json:
+        for result in iter_serial_ports():
+            sys.stdout.write(json.dumps(result) + '\n')
+            sys.stdout.flush()
+    else:
+        run_diagnostics()
 
 if __name__ == "__main__":
     try:
-        run_diagnostics()
+        main()
     except KeyboardInterrupt:
         print("\n\n⏹️  Diagnostics interrupted by user")
     except Exception as e:
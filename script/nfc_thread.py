@@ -8,6 +8,7 @@ import nfc
 import logging
 from PySide6.QtCore import QThread, Signal, QObject
 from typing import Optional, Dict, Any
+from .device_panel import ReaderConfig
 import serial.tools.list_ports
 
 logger = logging.getLogger(__name__)
@@ -30,12 +31,12 @@ class NFCThread(QThread):
         self.reader_config = None
         self.selected_port = None
     
-    def set_reader_type(self, reader_type: str, reader_config: Optional[Dict[str, Any]] = None):
+    def set_reader_type(self, reader_type: str, reader_config: Optional[ReaderConfig] = None):
         """Set the reader type and configuration.
         
         Args:
             reader_type: The type of reader to use
-            reader_config: Configuration dictionary for the reader
+            reader_config: Configuration of the reader type
         """
         self.reader_type = reader_type
         self.reader_config = reader_config
@@ -119,8 +120,8 @@ class NFCThread(QThread):
         if not self.reader_config:
             return []
         
-        backend = self.reader_config.get('backend', 'usb')
-        vid_pid_list = self.reader_config.get('vid_pid', [])
+        backend = self.reader_config.backend
+        vid_pid_list = self.reader_config.vid_pid or ()
         
         connection_params = []
         
@@ -200,8 +201,8 @@ class NFCThread(QThread):
                             break
                 
                 # If no specific port selected, try to find by VID:PID
-                if self.reader_config and self.reader_config.get('vid_pid'):
-                    vid_pid_list = self.reader_config['vid_pid']
+                if self.reader_config and self.reader_config.vid_pid:
+                    vid_pid_list = self.reader_config.vid_pid
                     ports = serial.tools.list_ports.comports()
                     for port in ports:
                         if port.vid and port.pid:
@@ -304,4 +305,4 @@ class NFCThread(QThread):
         if not self.reader_config:
             return self.reader_type
         
-        return self.reader_config.get('description', self.reader_type)
+        return self.reader_config.description
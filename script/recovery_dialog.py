@@ -3,7 +3,6 @@ Password recovery dialog for the NFC Reader/Writer application.
 """
 import os
 import json
-import hashlib
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -13,6 +12,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal
 
+# Recovery key helpers live with the rest of the password handling
+from .auth import generate_recovery_key, verify_recovery_key
+
 class RecoveryDialog(QDialog):
     """Dialog for recovering a forgotten password using a recovery key."""
     
@@ -159,68 +161,3 @@ class RecoveryDialog(QDialog):
                 "Error",
                 f"An error occurred during password recovery: {str(e)}"
             )
-
-
-def generate_recovery_key(salt: bytes, password_hash: str, output_path: str) -> bool:
-    """Generate a recovery key file for password recovery.
-    
-    Args:
-        salt: The password salt
-        password_hash: The hashed password
-        output_path: Path to save the recovery key file
-        
-    Returns:
-        bool: True if the recovery key was generated successfully, False otherwise
-    """
-    try:
-        # Create a recovery key with the same salt as the password
-        recovery_data = {
-            'salt': salt.hex(),
-            'recovery_hash': hashlib.sha256(
-                (salt.hex() + password_hash).encode()
-            ).hexdigest()
-        }
-        
-        # Save the recovery key to a file
-        with open(output_path, 'w') as f:
-            json.dump(recovery_data, f)
-            
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to generate recovery key: {e}")
-        return False
-
-
-def verify_recovery_key(recovery_key_path: str, salt: bytes, password_hash: str) -> bool:
-    """Verify if a recovery key is valid.
-    
-    Args:
-        recovery_key_path: Path to the recovery key file
-        salt: The stored password salt
-        password_hash: The stored password hash
-        
-    Returns:
-        bool: True if the recovery key is valid, False otherwise
-    """
-    try:
-        with open(recovery_key_path, 'r') as f:
-            recovery_data = json.load(f)
-            
-        # Verify the recovery key format
-        if not all(k in recovery_data for k in ['salt', 'recovery_hash']):
-            return False
-            
-        # Verify the recovery hash
-        expected_hash = hashlib.sha256(
-            (salt.hex() + password_hash).encode()
-        ).hexdigest()
-        
-        return recovery_data['recovery_hash'] == expected_hash
-        
-    except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
-        logger.error(f"Invalid recovery key: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"Error verifying recovery key: {e}")
-        return False
@@ -6,6 +6,7 @@ import sys
 import tempfile
 import unittest
 import json
+import hashlib
 from unittest.mock import patch, MagicMock
 
 # Add the script directory to the path
@@ -79,6 +80,51 @@ class TestPasswordRecovery(unittest.TestCase):
         result = verify_recovery_key(self.recovery_key_file, salt, password_hash)
         self.assertFalse(result)
     
+    def test_verify_recovery_key_v1(self):
+        """Test that recovery keys written before the 'v' field still verify."""
+        salt = os.urandom(32)
+        password_hash = "test_hash"
+        
+        # Version 1 format: SHA-256 of the hex salt followed by the hash
+        with open(self.recovery_key_file, 'w') as f:
+            json.dump({
+                'salt': salt.hex(),
+                'recovery_hash': hashlib.sha256((salt.hex() + password_hash).encode()).hexdigest()
+            }, f)
+        
+        result = verify_recovery_key(self.recovery_key_file, salt, password_hash)
+        self.assertTrue(result)
+    
+    def test_verify_recovery_key_v2(self):
+        """Test verifying a version 2 recovery key."""
+        salt = os.urandom(32)
+        password_hash = "test_hash"
+        
+        generate_recovery_key(salt, password_hash, self.recovery_key_file)
+        with open(self.recovery_key_file, 'r') as f:
+            data = json.load(f)
+        self.assertEqual(data['v'], 2)
+        self.assertEqual(data['recovery_hash'],
+                         hashlib.sha256(salt + password_hash.encode('ascii')).hexdigest())
+        
+        result = verify_recovery_key(self.recovery_key_file, salt, password_hash)
+        self.assertTrue(result)
+    
+    def test_verify_recovery_key_v2_wrong_hash(self):
+        """Test that a version 2 recovery key with a wrong hash is rejected."""
+        salt = os.urandom(32)
+        password_hash = "test_hash"
+        
+        with open(self.recovery_key_file, 'w') as f:
+            json.dump({
+                'v': 2,
+                'salt': salt.hex(),
+                'recovery_hash': hashlib.sha256(salt + b"different_hash").hexdigest()
+            }, f)
+        
+        result = verify_recovery_key(self.recovery_key_file, salt, password_hash)
+        self.assertFalse(result)
+    
     def test_recover_password(self):
         """Test recovering a password using a recovery key."""
         # Set a password and generate a recovery key
@@ -90,7 +136,7 @@ class TestPasswordRecovery(unittest.TestCase):
         
         # Verify results
         self.assertTrue(result)
-        self.assertTrue(self.auth_manager.verify_password(new_password))
+        self.assertTrue(self.auth_manager.verify_password(new_password)[0])
     
     @patch('PySide6.QtWidgets.QMessageBox')
     def test_recovery_dialog_ui(self, mock_msgbox):
@@ -139,8 +185,8 @@ class TestPasswordRecovery(unittest.TestCase):
         dialog.recover_password()
         
         # Verify password was changed
-        self.assertTrue(self.auth_manager.verify_password(new_password))
-        self.assertFalse(self.auth_manager.verify_password(old_password))
+        self.assertTrue(self.auth_manager.verify_password(new_password)[0])
+        self.assertFalse(self.auth_manager.verify_password(old_password)[0])
         
         # Verify recovery key was deleted
         self.assertFalse(os.path.exists(self.recovery_key_file))
@@ -55,7 +55,7 @@ def test_recovery_flow():
         
         # Verify password was set
         print("Verifying initial password...")
-        if auth_manager.verify_password(old_password):
+        if auth_manager.verify_password(old_password)[0]:
             print("✓ Initial password verified")
         else:
             print("✗ Failed to verify initial password")
@@ -69,7 +69,7 @@ def test_recovery_flow():
         if recovery_success:
             # Verify new password works
             print("Verifying new password...")
-            if auth_manager.verify_password(new_password):
+            if auth_manager.verify_password(new_password)[0]:
                 print("✓ New password verified")
             else:
                 print("✗ Failed to verify new password")
@@ -77,7 +77,7 @@ def test_recovery_flow():
             
             # Verify old password no longer works
             print("Verifying old password is no longer valid...")
-            if not auth_manager.verify_password(old_password):
+            if not auth_manager.verify_password(old_password)[0]:
                 print("✓ Old password is no longer valid")
             else:
                 print("✗ Old password is still valid")